@@ -0,0 +1,220 @@
+"""
+Columnar storage for large collections of ingredients.
+
+Holding millions of ``Ingredient`` models is expensive, so ``IngredientBatch``
+stores the same information column by column: names as codes into an interned
+name table, quantities as a packed float64 array and units as small integer
+codes into a unit table. Bulk conversions resolve each distinct unit
+conversion only once; the rows themselves are still processed in Python.
+"""
+
+import math
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from pint import Unit
+
+from model import Ingredient, Recipe
+from units import conversion_factor
+
+
+class IngredientBatch:
+    """
+    A column-oriented batch of ingredients.
+
+    Row ``i`` of the batch is the ingredient
+    ``names[name_codes[i]]``, ``quantities[i]``, ``units[unit_codes[i]]``.
+    """
+
+    __slots__ = (
+        "names",
+        "units",
+        "name_codes",
+        "quantities",
+        "unit_codes",
+        "_name_index",
+        "_unit_index",
+    )
+
+    def __init__(
+        self,
+        names: Optional[List[str]] = None,
+        units: Optional[List[Unit]] = None,
+        name_codes: Optional[array] = None,
+        quantities: Optional[array] = None,
+        unit_codes: Optional[array] = None,
+    ):
+        self.names: List[str] = names if names is not None else []
+        self.units: List[Unit] = units if units is not None else []
+        self.name_codes: array = name_codes if name_codes is not None else array("I")
+        self.quantities: array = quantities if quantities is not None else array("d")
+        self.unit_codes: array = unit_codes if unit_codes is not None else array("H")
+        self._name_index: Dict[str, int] = {n: i for i, n in enumerate(self.names)}
+        self._unit_index: Dict[Unit, int] = {u: i for i, u in enumerate(self.units)}
+
+    @classmethod
+    def from_ingredients(cls, ingredients: Iterable[Ingredient]) -> "IngredientBatch":
+        """
+        Builds a batch from ingredient models.
+
+        Args:
+            ingredients: The ingredients to pack, in order.
+
+        Returns:
+            IngredientBatch: A batch holding the same rows.
+        """
+        batch = cls()
+        for ingredient in ingredients:
+            batch.append(ingredient.name, ingredient.quantity, ingredient.unit)
+        return batch
+
+    def append(self, name: str, quantity: float, unit: Unit) -> None:
+        """
+        Appends a single row to the batch without validation.
+
+        Args:
+            name: The ingredient name.
+            quantity: The ingredient amount.
+            unit: The Pint unit of the amount.
+        """
+        name_code = self._name_index.get(name)
+        if name_code is None:
+            name_code = self._name_index[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        unit_code = self._unit_index.get(unit)
+        if unit_code is None:
+            unit_code = self._unit_index[unit] = len(self.units)
+            self.units.append(unit)
+        self.name_codes.append(name_code)
+        self.quantities.append(quantity)
+        self.unit_codes.append(unit_code)
+
+    def to_ingredients(self) -> List[Ingredient]:
+        """
+        Unpacks the batch into validated ingredient models.
+
+        Returns:
+            List[Ingredient]: One ingredient per row, in order.
+        """
+        names, units = self.names, self.units
+        return [
+            Ingredient.model_validate(
+                {
+                    "name": names[name_code],
+                    "quantity": quantity,
+                    "unit": units[unit_code],
+                }
+            )
+            for name_code, quantity, unit_code in zip(
+                self.name_codes, self.quantities, self.unit_codes
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.quantities)
+
+    def scale(self, factor: float) -> "IngredientBatch":
+        """
+        Returns a new batch with every quantity multiplied by ``factor``.
+
+        Args:
+            factor: The positive scaling factor.
+
+        Returns:
+            IngredientBatch: The scaled batch.
+
+        Raises:
+            ValueError: If the factor is not a finite number greater than 0.
+        """
+        if not (math.isfinite(factor) and factor > 0):
+            raise ValueError(
+                f"Scaling factor must be a finite number greater than 0. Got: {factor}"
+            )
+        return IngredientBatch(
+            list(self.names),
+            list(self.units),
+            array("I", self.name_codes),
+            array("d", [quantity * factor for quantity in self.quantities]),
+            array("H", self.unit_codes),
+        )
+
+    def quantities_in(self, unit: Unit) -> array:
+        """
+        Returns every quantity of the batch converted to ``unit``.
+
+        Each distinct source unit is converted once; the rows then only need a
+        table lookup and a multiplication.
+
+        Args:
+            unit: The target unit, which must be compatible with every row.
+
+        Returns:
+            array: The converted quantities as a float64 array.
+
+        Raises:
+            DimensionalityError: If any row has an incompatible unit.
+        """
+        factors = [conversion_factor(source, unit) for source in self.units]
+        return array(
+            "d",
+            [
+                quantity * factors[unit_code]
+                for quantity, unit_code in zip(self.quantities, self.unit_codes)
+            ],
+        )
+
+    def sum_by_name(self, unit: Unit) -> Dict[str, float]:
+        """
+        Sums the quantities of each ingredient name, expressed in ``unit``.
+
+        Args:
+            unit: The target unit, which must be compatible with every row.
+
+        Returns:
+            Dict[str, float]: The total amount per ingredient name.
+
+        Raises:
+            DimensionalityError: If any row has an incompatible unit.
+        """
+        totals = [0.0] * len(self.names)
+        for name_code, quantity in zip(self.name_codes, self.quantities_in(unit)):
+            totals[name_code] += quantity
+        return {name: total for name, total in zip(self.names, totals)}
+
+
+def scale_recipes(
+    recipes: Sequence[Recipe],
+    factors: Union[float, Sequence[float]],
+    normalize: bool = False,
+) -> List[Recipe]:
+    """
+    Scales many recipes with ``Recipe.scale``.
+
+    All factors are checked before any recipe is scaled, so a bad factor
+    fails fast instead of after part of the work.
+
+    Args:
+        recipes: The recipes to scale.
+        factors: One positive factor for all recipes, or one factor per recipe.
+        normalize: If True, re-express each quantity in the most readable
+            unit of its family (see ``units.normalize_quantity``).
+
+    Returns:
+        List[Recipe]: The scaled recipes, in the same order.
+
+    Raises:
+        ValueError: If a factor is not a finite positive number or the factor
+            count is wrong.
+    """
+    if isinstance(factors, (int, float)):
+        factors = [factors] * len(recipes)
+    if len(factors) != len(recipes):
+        raise ValueError(
+            f"Expected {len(recipes)} scaling factors. Got: {len(factors)}"
+        )
+    if not all(math.isfinite(factor) and factor > 0 for factor in factors):
+        raise ValueError(
+            f"Scaling factors must be finite numbers greater than 0. Got: {factors}"
+        )
+    return [recipe.scale(factor, normalize) for recipe, factor in zip(recipes, factors)]
@@ -0,0 +1,93 @@
+"""
+Benchmark comparing ways of constructing recipes.
+
+Run with ``python bench_construction.py``. Builds the same synthetic recipe
+dicts through full validation, through ``Recipe.load_without_image_checks``
+and, for reference, through Pydantic's ``model_construct``, which skips
+validation entirely but runs in Python and is slower than pydantic-core.
+"""
+
+import gc
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from model import Ingredient, Recipe, Step
+
+UNITS = ["g", "kg", "ml", "cup", "tsp", "tbsp", "dimensionless"]
+
+
+def make_records(
+    count: int, ingredients_per_recipe: int = 10, image_path: Optional[Path] = None
+) -> List[Dict[str, Any]]:
+    """Builds synthetic recipe dicts with unit strings."""
+    return [
+        {
+            "recipe_id": f"recipe-{i}",
+            "name": f"Recipe {i}",
+            "description": "A synthetic benchmark recipe.",
+            "ingredients": [
+                {
+                    "name": f"Ingredient {chr(65 + j)}",
+                    "quantity": 1.0 + j,
+                    "unit": UNITS[j % len(UNITS)],
+                }
+                for j in range(ingredients_per_recipe)
+            ],
+            "steps": [{"description": f"Step {k}."} for k in range(5)],
+            "prep_time_minutes": 10,
+            "cook_time_minutes": 20,
+            "image_path": image_path,
+        }
+        for i in range(count)
+    ]
+
+
+def construct(record: Dict[str, Any]) -> Recipe:
+    """Builds a recipe with Pydantic's model_construct at every level."""
+    return Recipe.model_construct(
+        **{
+            **record,
+            "ingredients": [
+                Ingredient.model_construct(**i) for i in record["ingredients"]
+            ],
+            "steps": [Step.model_construct(**s) for s in record["steps"]],
+        }
+    )
+
+
+def best_of(build: Callable[[], object], repeats: int = 3) -> float:
+    """Returns the fastest wall-clock time of several runs, in seconds."""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            build()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        image = Path(folder) / "dish.png"
+        image.touch()
+        print(
+            f"{'10k recipes (ms)':<18}{'validated':>12}{'no images':>12}"
+            f"{'construct':>12}"
+        )
+        for label, path in [("without image", None), ("with image", image)]:
+            records = make_records(10_000, image_path=path)
+            timings = [
+                best_of(lambda: [Recipe.model_validate(r) for r in records]),
+                best_of(lambda: [Recipe.load_without_image_checks(r) for r in records]),
+                best_of(lambda: [construct(r) for r in records]),
+            ]
+            print(f"{label:<18}" + "".join(f"{t * 1000:>12.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark comparing Pint's default registry against the compact kitchen registry.
+
+Run with ``python bench_registry.py``. Each registry is built from scratch
+(without Pint's on-disk cache) and measured for wall-clock construction time
+and peak traced memory.
+"""
+
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from pint import UnitRegistry
+
+from units import KITCHEN_UNITS_FILE
+
+
+def measure(build: Callable[[], UnitRegistry], repeats: int = 5) -> Tuple[float, int]:
+    """
+    Measures construction time and peak memory for a registry factory.
+
+    Args:
+        build: Callable that constructs a registry and resolves a unit.
+        repeats: Number of timed constructions; the fastest is reported.
+
+    Returns:
+        Tuple[float, int]: Best construction time in seconds and peak bytes allocated.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def build_default() -> UnitRegistry:
+    """Builds Pint's full default registry."""
+    registry = UnitRegistry()
+    registry.gram
+    return registry
+
+
+def build_kitchen() -> UnitRegistry:
+    """Builds the compact kitchen registry from kitchen_units.txt."""
+    registry = UnitRegistry(str(KITCHEN_UNITS_FILE))
+    registry.gram
+    return registry
+
+
+def main():
+    results = {
+        "default UnitRegistry()": measure(build_default),
+        "kitchen registry": measure(build_kitchen),
+    }
+    print(f"{'registry':<24}{'build (ms)':>12}{'peak (KiB)':>12}")
+    for label, (seconds, peak) in results.items():
+        print(f"{label:<24}{seconds * 1000:>12.1f}{peak / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import pytest
+from pint import Unit
+
+from model import Ingredient, Recipe, Step
+
+# An ingredient given to ``make_recipe``: a bare name, or (name, quantity, unit).
+IngredientSpec = Union[str, Tuple[str, float, Union[Unit, str]]]
+
+
+def _make_recipe(
+    recipe_id: Optional[str] = None,
+    *ingredients: IngredientSpec,
+    quantity: float = 1.0,
+    unit: Union[Unit, str] = "gram",
+    steps: Sequence[str] = ("Cook.",),
+    **fields,
+) -> Recipe:
+    """
+    Builds a valid recipe for tests.
+
+    Args:
+        recipe_id: The recipe id; the name defaults to its title case, or
+            "Dish" without an id.
+        *ingredients: Bare names, which use ``quantity`` and ``unit``, or
+            (name, quantity, unit) tuples.
+        quantity: The amount of ingredients given by name only.
+        unit: The unit of ingredients given by name only.
+        steps: The step descriptions.
+        **fields: Any other Recipe fields, e.g. name or prep_time_minutes.
+
+    Returns:
+        Recipe: The validated recipe.
+    """
+    fields.setdefault("name", recipe_id.title() if recipe_id else "Dish")
+    return Recipe(
+        recipe_id=recipe_id,
+        ingredients=[
+            Ingredient(name=spec, quantity=quantity, unit=unit)
+            if isinstance(spec, str)
+            else Ingredient(name=spec[0], quantity=spec[1], unit=spec[2])
+            for spec in ingredients
+        ],
+        steps=[Step(description=description) for description in steps],
+        **fields,
+    )
+
+
+@pytest.fixture
+def make_recipe() -> Callable[..., Recipe]:
+    """Returns a factory building valid recipes; see ``_make_recipe``."""
+    return _make_recipe
@@ -0,0 +1,396 @@
+"""
+"What can I cook now?" queries over a recipe catalogue.
+
+``FeasibilityEngine`` pre-computes, for every recipe, the total amount of each
+ingredient it needs in its aggregation unit. Ingredient names are encoded as bits
+of a vocabulary (``IngredientBitsets``), so "recipes whose ingredients are all
+in stock" is answered with a handful of big-integer bitwise operations; only
+those candidates are then checked for quantities against the ``Inventory``.
+
+``FeasibilityEngine.closest`` ranks recipes that are not (yet) cookable by how
+little would have to be bought, keeping the best ``k`` in a bounded heap.
+"""
+
+import heapq
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pint import Unit
+from pydantic import BaseModel, Field
+
+from density import ingredient_unit
+from fuzzy import TrigramIndex
+from inventory import Inventory
+from model import Ingredient, Recipe
+from names import canonical_name
+from units import normalize_quantity
+
+# Relative slack when comparing stock to requirements, absorbing float error.
+_TOLERANCE = 1e-9
+
+# Total amount needed per canonical ingredient name, per aggregation unit.
+Requirements = Dict[str, Dict[Unit, float]]
+
+
+def recipe_requirements(recipe: Recipe) -> Requirements:
+    """
+    Sums a recipe's ingredients per canonical name and aggregation unit.
+
+    Mass, volume and counts of an ingredient are combined where its density
+    or piece weight is known (see ``density.ingredient_unit``).
+
+    Args:
+        recipe: The recipe.
+
+    Returns:
+        Requirements: The amount needed of each ingredient, in aggregation units.
+    """
+    requirements: Requirements = {}
+    for ingredient in recipe.ingredients:
+        name = canonical_name(ingredient.name)
+        unit, factor = ingredient_unit(name, ingredient.unit)
+        amounts = requirements.setdefault(name, {})
+        amounts[unit] = amounts.get(unit, 0.0) + ingredient.quantity * factor
+    return requirements
+
+
+def has_enough(requirements: Requirements, inventory: Inventory) -> bool:
+    """
+    Returns whether the inventory holds every required amount.
+
+    Args:
+        requirements: The amounts needed, from ``recipe_requirements``.
+        inventory: The available stock.
+
+    Returns:
+        bool: True if every ingredient is in stock in a sufficient quantity.
+    """
+    for name, amounts in requirements.items():
+        for unit, amount in amounts.items():
+            if inventory.total(name, unit) < amount * (1 - _TOLERANCE):
+                return False
+    return True
+
+
+def shortfall(
+    requirements: Requirements, stock: Dict[str, Dict[Unit, float]]
+) -> Tuple[int, float]:
+    """
+    Measures how far an inventory is from covering a recipe's requirements.
+
+    Args:
+        requirements: The amounts needed, from ``recipe_requirements``.
+        stock: Inventory totals per canonical name and aggregation unit.
+
+    Returns:
+        Tuple[int, float]: The number of requirements not fully covered, and
+        the sum of the fraction of each requirement that is missing.
+    """
+    count = 0
+    score = 0.0
+    for name, amounts in requirements.items():
+        totals = stock.get(name, {})
+        for unit, amount in amounts.items():
+            lacking = amount - totals.get(unit, 0.0)
+            if lacking > amount * _TOLERANCE:
+                count += 1
+                score += lacking / amount
+    return count, score
+
+
+class RecipeShortfall(BaseModel):
+    """
+    A recipe together with the ingredients still missing to cook it.
+    """
+
+    recipe: Recipe = Field(..., description="The ranked recipe.")
+    missing: List[Ingredient] = Field(
+        default_factory=list,
+        description="The amount of each ingredient to buy, in readable units.",
+    )
+    score: float = Field(
+        ...,
+        ge=0,
+        description=(
+            "Sum of the fraction of each requirement that is missing; "
+            "0 means cookable, lower is closer."
+        ),
+    )
+
+    @property
+    def missing_count(self) -> int:
+        """The number of ingredients that are missing or short."""
+        return len(self.missing)
+
+
+def iter_bits(bitset: int) -> Iterator[int]:
+    """
+    Yields the positions of the set bits of a bitset, in increasing order.
+
+    Args:
+        bitset: A non-negative integer used as a bitset.
+
+    Yields:
+        int: Each set bit position.
+    """
+    digits = bin(bitset)[:1:-1]
+    position = digits.find("1")
+    while position != -1:
+        yield position
+        position = digits.find("1", position + 1)
+
+
+class IngredientBitsets:
+    """
+    Encodes recipes as bitsets over a vocabulary of ingredient names.
+
+    Each name gets a bit, and each recipe a mask of the names it uses. The
+    transposed view is kept too: for every name, a bitset of the recipes
+    (by position) that use it. Python integers serve as arbitrary-length
+    bitsets, so set operations over the whole catalogue run in C.
+
+    Setting one bit of a large integer copies it, so the per-name columns are
+    accumulated in byte arrays and converted to integers on first use after
+    a change.
+    """
+
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+        self._column_bytes: List[bytearray] = []
+        self._columns: Optional[List[int]] = None
+        self.recipe_masks: List[int] = []
+
+    def add(self, names: Iterable[str]) -> int:
+        """
+        Adds a recipe's ingredient names, growing the vocabulary as needed.
+
+        Args:
+            names: The recipe's canonical ingredient names.
+
+        Returns:
+            int: The recipe's position.
+        """
+        position = len(self.recipe_masks)
+        byte, bit_in_byte = divmod(position, 8)
+        mask = 0
+        for name in names:
+            bit = self._bits.get(name)
+            if bit is None:
+                bit = self._bits[name] = len(self._column_bytes)
+                self._column_bytes.append(bytearray())
+            mask |= 1 << bit
+            column = self._column_bytes[bit]
+            if len(column) <= byte:
+                column.extend(bytes(byte + 1 - len(column)))
+            column[byte] |= 1 << bit_in_byte
+        self.recipe_masks.append(mask)
+        self._columns = None
+        return position
+
+    def __len__(self) -> int:
+        return len(self.recipe_masks)
+
+    def _column_ints(self) -> List[int]:
+        """Returns the per-name recipe bitsets, converting them after changes."""
+        if self._columns is None:
+            self._columns = [
+                int.from_bytes(column, "little") for column in self._column_bytes
+            ]
+        return self._columns
+
+    def mask(self, names: Iterable[str]) -> int:
+        """
+        Encodes a set of canonical names; names outside the vocabulary are ignored.
+
+        Args:
+            names: The names, e.g. those of an inventory snapshot.
+
+        Returns:
+            int: The bitset over the vocabulary.
+        """
+        mask = 0
+        for name in names:
+            bit = self._bits.get(name)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def recipes_with(self, name: str) -> int:
+        """
+        Returns the bitset of recipe positions that use a canonical name.
+
+        Args:
+            name: The canonical ingredient name.
+
+        Returns:
+            int: The recipe bitset; 0 if no recipe uses the name.
+        """
+        bit = self._bits.get(name)
+        return self._column_ints()[bit] if bit is not None else 0
+
+    def subsets_of(self, mask: int) -> int:
+        """
+        Returns the recipes whose ingredient names are all within ``mask``.
+
+        A recipe qualifies unless it uses some name missing from ``mask``, so
+        the result is every recipe minus the union of the missing names'
+        columns.
+
+        Args:
+            mask: A bitset over the vocabulary, from ``mask()``.
+
+        Returns:
+            int: The bitset of qualifying recipe positions.
+        """
+        excluded = 0
+        for bit, column in enumerate(self._column_ints()):
+            if not mask >> bit & 1:
+                excluded |= column
+        return ((1 << len(self.recipe_masks)) - 1) & ~excluded
+
+
+class FeasibilityEngine:
+    """
+    Finds the recipes of a catalogue that can be cooked from an inventory.
+    """
+
+    def __init__(self, recipes: Iterable[Recipe] = ()):
+        self._recipes: List[Recipe] = []
+        self._requirements: List[Requirements] = []
+        self._bitsets = IngredientBitsets()
+        self._names = TrigramIndex()
+        for recipe in recipes:
+            self.add(recipe)
+
+    def add(self, recipe: Recipe) -> None:
+        """
+        Adds a recipe to the catalogue and indexes its ingredient names.
+
+        Args:
+            recipe: The recipe to add.
+        """
+        requirements = recipe_requirements(recipe)
+        self._bitsets.add(requirements)
+        for name in requirements:
+            self._names.add(name)
+        self._recipes.append(recipe)
+        self._requirements.append(requirements)
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def closest(
+        self, inventory: Inventory, k: int = 10, max_missing: Optional[int] = None
+    ) -> List[RecipeShortfall]:
+        """
+        Returns the ``k`` recipes that need the least shopping to be cooked.
+
+        Recipes are ranked by the number of missing or short ingredients, then
+        by the fraction of the required amounts that is missing, then by
+        catalogue order. Cookable recipes rank first with an empty shortfall.
+        The number of ingredient names missing from the inventory, read off
+        the bitsets, is a lower bound on a recipe's shortfall, so recipes that
+        cannot beat ``max_missing`` or the current k-th best are skipped
+        before their quantities are compared.
+
+        Args:
+            inventory: The available stock.
+            k: The number of recipes to return.
+            max_missing: If set, only recipes missing at most this many
+                ingredients are returned.
+
+        Returns:
+            List[RecipeShortfall]: Up to ``k`` shortfalls, closest first.
+
+        Raises:
+            ValueError: If k is not positive or max_missing is negative.
+        """
+        if k <= 0:
+            raise ValueError(f"k must be greater than 0. Got: {k}")
+        if max_missing is not None and max_missing < 0:
+            raise ValueError(f"max_missing must be at least 0. Got: {max_missing}")
+        names = inventory.names()
+        stock = {name: inventory.totals(name) for name in names}
+        in_stock = self._bitsets.mask(names)
+        limit = max_missing if max_missing is not None else float("inf")
+        # Max-heap of the k best entries via negated keys; heap[0] is the worst.
+        heap: List[Tuple[int, float, int]] = []
+        for position, mask in enumerate(self._bitsets.recipe_masks):
+            absent = (mask & ~in_stock).bit_count()
+            if absent > limit or (len(heap) == k and absent > -heap[0][0]):
+                continue
+            count, score = shortfall(self._requirements[position], stock)
+            if count > limit:
+                continue
+            entry = (-count, -score, -position)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+        return [
+            self._describe_shortfall(-position, -score, stock)
+            for _, score, position in sorted(heap, reverse=True)
+        ]
+
+    def _describe_shortfall(
+        self, position: int, score: float, stock: Dict[str, Dict[Unit, float]]
+    ) -> RecipeShortfall:
+        """Builds the shortfall of one ranked recipe with readable missing amounts."""
+        missing = []
+        for name, amounts in self._requirements[position].items():
+            totals = stock.get(name, {})
+            for unit, amount in amounts.items():
+                lacking = amount - totals.get(unit, 0.0)
+                if lacking > amount * _TOLERANCE:
+                    quantity, readable_unit = normalize_quantity(lacking, unit)
+                    missing.append(
+                        Ingredient.model_validate(
+                            {"name": name, "quantity": quantity, "unit": readable_unit}
+                        )
+                    )
+        return RecipeShortfall(
+            recipe=self._recipes[position], missing=missing, score=score
+        )
+
+    def recipes_using(
+        self, name: str, fuzzy: bool = False, threshold: float = 0.3
+    ) -> List[Recipe]:
+        """
+        Returns the recipes that use an ingredient.
+
+        Args:
+            name: The ingredient name, in any spelling.
+            fuzzy: If True, also match ingredient names that are similar to
+                ``name``, e.g. "parmesan" matches "parmesan cheese".
+            threshold: The minimum trigram similarity for fuzzy matches.
+
+        Returns:
+            List[Recipe]: The recipes, in catalogue order.
+        """
+        if fuzzy:
+            bitset = 0
+            for match, _ in self._names.search(name, len(self._names) or 1, threshold):
+                bitset |= self._bitsets.recipes_with(match)
+        else:
+            bitset = self._bitsets.recipes_with(canonical_name(name))
+        return [self._recipes[position] for position in iter_bits(bitset)]
+
+    def cookable(self, inventory: Inventory) -> List[Recipe]:
+        """
+        Returns every recipe that can be cooked right now.
+
+        Recipes are first narrowed down with bitset operations to those whose
+        ingredient names are all in stock; only these candidates have their
+        quantities compared, with unit conversion, against the inventory.
+
+        Args:
+            inventory: The available stock.
+
+        Returns:
+            List[Recipe]: The cookable recipes, in catalogue order.
+        """
+        candidates = self._bitsets.subsets_of(self._bitsets.mask(inventory.names()))
+        return [
+            self._recipes[position]
+            for position in iter_bits(candidates)
+            if has_enough(self._requirements[position], inventory)
+        ]
@@ -0,0 +1,148 @@
+"""
+Per-ingredient conversions between mass, volume and piece counts.
+
+Pint converts cups to milliliters but not cups of flour to grams, because the
+factor depends on the ingredient. ``INGREDIENT_DENSITIES`` and
+``PIECE_WEIGHTS`` supply those factors for common ingredients, keyed by
+canonical name (see ``names.canonical_name``). ``ingredient_unit`` picks the
+one unit all amounts of an ingredient are aggregated in, so "1 cup flour" and
+"200 g flour", or "3 eggs" and "100 g eggs", add up. Lookups are cached per
+(name, unit) pair, so aggregation pays for a conversion once per pair.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from pint import Unit
+
+from units import canonical_unit, conversion_factor, parse_unit
+
+# Grams per milliliter of ingredients measured both by volume and by weight.
+INGREDIENT_DENSITIES = {
+    "flour": 0.53,
+    "whole wheat flour": 0.51,
+    "sugar": 0.85,
+    "brown sugar": 0.83,
+    "icing sugar": 0.56,
+    "butter": 0.96,
+    "rice": 0.85,
+    "oat": 0.36,
+    "cocoa powder": 0.42,
+    "salt": 1.2,
+    "baking soda": 0.92,
+    "baking powder": 0.9,
+    "honey": 1.42,
+    "yogurt": 1.03,
+    "water": 1.0,
+    "milk": 1.03,
+    "cream": 1.01,
+    "olive oil": 0.91,
+    "vegetable oil": 0.92,
+    "vinegar": 1.01,
+    "soy sauce": 1.15,
+    "stock": 1.0,
+}
+
+# Grams per piece of ingredients that are counted.
+PIECE_WEIGHTS = {
+    "egg": 50.0,
+    "onion": 150.0,
+    "garlic clove": 5.0,
+    "lemon": 100.0,
+    "lime": 65.0,
+    "tomato": 120.0,
+    "potato": 170.0,
+    "carrot": 60.0,
+    "apple": 180.0,
+    "banana": 120.0,
+    "bell pepper": 160.0,
+}
+
+# Ingredients aggregated in milliliters rather than grams.
+LIQUIDS = frozenset(
+    {
+        "water",
+        "milk",
+        "cream",
+        "olive oil",
+        "vegetable oil",
+        "vinegar",
+        "soy sauce",
+        "stock",
+    }
+)
+
+# Maximum number of (name, unit) pairs kept by the lookup cache.
+DENSITY_CACHE_SIZE = 4096
+
+
+def _grams_per_unit(name: str, unit: Unit) -> Optional[float]:
+    """Returns the grams in one canonical ``unit`` of an ingredient, if known."""
+    if unit == parse_unit("gram"):
+        return 1.0
+    if unit == parse_unit("milliliter"):
+        return INGREDIENT_DENSITIES.get(name)
+    if unit == parse_unit("dimensionless"):
+        return PIECE_WEIGHTS.get(name)
+    return None
+
+
+@lru_cache(maxsize=DENSITY_CACHE_SIZE)
+def ingredient_unit(name: str, unit: Unit) -> Tuple[Unit, float]:
+    """
+    Returns the unit an ingredient's amounts are aggregated in.
+
+    Counted ingredients (``PIECE_WEIGHTS``) aggregate in pieces, ``LIQUIDS``
+    in milliliters and other ingredients with a known density in grams, so
+    mass, volume and counts of the same ingredient combine. Ingredients
+    without table entries fall back to ``units.canonical_unit``.
+
+    Args:
+        name: The canonical ingredient name.
+        unit: The unit an amount of the ingredient is expressed in.
+
+    Returns:
+        Tuple[Unit, float]: The aggregation unit, and the factor converting a
+        magnitude in ``unit`` into it.
+
+    Raises:
+        ValueError: If the conversion is not a pure scaling (e.g. temperatures).
+    """
+    base = canonical_unit(unit)
+    factor = conversion_factor(unit, base)
+    grams = _grams_per_unit(name, base)
+    if grams is None:
+        return base, factor
+    if name in PIECE_WEIGHTS:
+        target, target_grams = parse_unit("dimensionless"), PIECE_WEIGHTS[name]
+    elif name in LIQUIDS and name in INGREDIENT_DENSITIES:
+        target, target_grams = parse_unit("milliliter"), INGREDIENT_DENSITIES[name]
+    else:
+        target, target_grams = parse_unit("gram"), 1.0
+    return target, factor * grams / target_grams
+
+
+def convert_ingredient(
+    name: str, magnitude: float, source: Unit, target: Unit
+) -> float:
+    """
+    Converts an amount of an ingredient, across dimensions where the tables allow.
+
+    Args:
+        name: The canonical ingredient name.
+        magnitude: The amount expressed in ``source``.
+        source: The unit the amount is expressed in.
+        target: The unit to convert to.
+
+    Returns:
+        float: The amount expressed in ``target``.
+
+    Raises:
+        DimensionalityError: If the units are incompatible for this ingredient.
+    """
+    source_base, source_factor = ingredient_unit(name, source)
+    target_base, target_factor = ingredient_unit(name, target)
+    if source_base != target_base:
+        # Not bridged by the tables; Pint raises DimensionalityError.
+        return magnitude * conversion_factor(source, target)
+    return magnitude * source_factor / target_factor
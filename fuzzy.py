@@ -0,0 +1,124 @@
+"""
+Fuzzy ingredient name matching with a trigram index.
+
+Names are compared by the character trigrams of their canonical form (see
+``names.canonical_name``), so "parmesan" finds "parmesan cheese" and "tomatos"
+finds "tomato". ``TrigramIndex`` keeps an inverted index from trigram to the
+names containing it: a query only touches the names sharing at least one of
+its trigrams, which keeps lookups fast over tens of thousands of names.
+"""
+
+import heapq
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from names import canonical_name
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """
+    Returns the character trigrams of each word of a text.
+
+    Each word is padded with two leading spaces and one trailing space, so
+    word beginnings weigh more and word order does not matter.
+
+    Args:
+        text: The text, already canonicalized.
+
+    Returns:
+        FrozenSet[str]: The distinct trigrams.
+    """
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """
+    An incremental trigram index over canonical ingredient names.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._postings: Dict[str, Set[str]] = {}
+        self._trigrams: Dict[str, FrozenSet[str]] = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str) -> str:
+        """
+        Indexes a name; names with an already indexed canonical form are ignored.
+
+        Args:
+            name: The ingredient name, in any spelling.
+
+        Returns:
+            str: The canonical name that was indexed.
+        """
+        key = canonical_name(name)
+        if key not in self._trigrams:
+            grams = trigrams(key)
+            self._trigrams[key] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+        return key
+
+    def discard(self, name: str) -> None:
+        """
+        Removes a name from the index if it is present.
+
+        Args:
+            name: The ingredient name, in any spelling.
+        """
+        key = canonical_name(name)
+        grams = self._trigrams.pop(key, None)
+        if grams is None:
+            return
+        for gram in grams:
+            keys = self._postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+
+    def __contains__(self, name: str) -> bool:
+        return canonical_name(name) in self._trigrams
+
+    def __len__(self) -> int:
+        return len(self._trigrams)
+
+    def search(
+        self, query: str, limit: int = 5, threshold: float = 0.3
+    ) -> List[Tuple[str, float]]:
+        """
+        Returns the indexed names most similar to a query.
+
+        Similarity is the Jaccard index of the two trigram sets: shared
+        trigrams divided by distinct trigrams across both names.
+
+        Args:
+            query: The text to match, in any spelling.
+            limit: The maximum number of matches to return.
+            threshold: The minimum similarity, between 0 and 1.
+
+        Returns:
+            List[Tuple[str, float]]: (canonical name, similarity) pairs, most
+            similar first, ties broken alphabetically.
+
+        Raises:
+            ValueError: If limit is not positive or threshold is outside [0, 1].
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be greater than 0. Got: {limit}")
+        if not 0 <= threshold <= 1:
+            raise ValueError(f"threshold must be between 0 and 1. Got: {threshold}")
+        grams = trigrams(canonical_name(query))
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        scored = []
+        for key, count in shared.items():
+            similarity = count / (len(grams) + len(self._trigrams[key]) - count)
+            if similarity >= threshold:
+                scored.append((key, similarity))
+        return heapq.nsmallest(limit, scored, key=lambda match: (-match[1], match[0]))
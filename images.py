@@ -0,0 +1,237 @@
+"""
+Filesystem checks for recipe images.
+
+Validating large catalogues re-checks the same ``Recipe.image_path`` values
+over and over, which is slow on network filesystems. ``StatCache`` remembers
+each answer for a time-to-live window, and ``BackgroundImageVerifier`` lets
+validation defer existence checks to a thread pool entirely. For bulk imports,
+``verify_recipe_images`` checks a whole batch of recipes concurrently with
+asyncio after they were validated with format-only image checks.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from model import Recipe
+
+# File extensions accepted for recipe images.
+ALLOWED_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+
+# Default maximum number of paths kept by a StatCache.
+STAT_CACHE_SIZE = 4096
+
+
+def is_supported_image_format(path: Path) -> bool:
+    """
+    Returns whether the path has a JPEG, PNG, or WebP file extension.
+
+    Args:
+        path: The image path to check.
+
+    Returns:
+        bool: True if the extension is one of ``ALLOWED_IMAGE_EXTENSIONS``.
+    """
+    return path.suffix.lower() in ALLOWED_IMAGE_EXTENSIONS
+
+
+class StatCache:
+    """
+    A time-to-live cache of whether paths point to existing files.
+
+    Each path costs at most one filesystem hit per ``ttl_seconds`` window.
+    At most ``max_entries`` paths are kept, evicting the least recently used,
+    so the shared cache stays bounded however many paths are validated.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_entries: int = STAT_CACHE_SIZE,
+    ):
+        if ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds must be at least 0. Got: {ttl_seconds}")
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be greater than 0. Got: {max_entries}")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Path, Tuple[float, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_file(self, path: Path) -> bool:
+        """
+        Returns whether ``path`` is an existing file, using the cached answer if fresh.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            bool: True if the path points to a file.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                self._entries[path] = entry
+                return entry[1]
+        exists = path.is_file()
+        with self._lock:
+            self._entries[path] = (now, exists)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return exists
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """
+        Forgets the cached answer for one path, or for every path.
+
+        Args:
+            path: The path to forget; None clears the whole cache.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+# Shared cache used by Recipe.validate_image_format.
+image_stat_cache = StatCache()
+
+
+class BackgroundImageVerifier:
+    """
+    Checks image paths for existence on a background thread pool.
+
+    Pass an instance as ``context={"image_verifier": verifier}`` when
+    validating recipes: image paths are then queued here instead of being
+    checked inline, and ``missing()`` reports the ones that do not exist.
+    """
+
+    def __init__(self, stat_cache: Optional[StatCache] = None, max_workers: int = 8):
+        self.stat_cache = stat_cache if stat_cache is not None else image_stat_cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._checks: Dict[Path, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, path: Path) -> None:
+        """
+        Queues a path for an existence check; repeated paths are checked once.
+
+        Args:
+            path: The image path to check.
+        """
+        with self._lock:
+            if path not in self._checks:
+                self._checks[path] = self._executor.submit(
+                    self.stat_cache.is_file, path
+                )
+
+    def missing(self) -> List[Path]:
+        """
+        Waits for all queued checks and returns the paths that are not files.
+
+        Returns:
+            List[Path]: The missing image paths, in submission order.
+        """
+        with self._lock:
+            checks = list(self._checks.items())
+        return [path for path, check in checks if not check.result()]
+
+    def close(self) -> None:
+        """Shuts down the worker threads after pending checks finish."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "BackgroundImageVerifier":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ImageProblem(BaseModel):
+    """
+    Describes a recipe whose image is missing or has an unsupported format.
+    """
+
+    recipe_id: Optional[str] = Field(None, description="The affected recipe's id.")
+    recipe_name: str = Field(..., description="The affected recipe's name.")
+    image_path: Path = Field(..., description="The offending image path.")
+    problem: Literal["missing", "wrong_format"] = Field(
+        ..., description="Whether the image does not exist or has the wrong format."
+    )
+
+
+async def verify_recipe_images(
+    recipes: Iterable["Recipe"],
+    max_concurrency: int = 32,
+    stat_cache: Optional[StatCache] = None,
+) -> List[ImageProblem]:
+    """
+    Checks the image paths of a batch of recipes concurrently.
+
+    Meant for recipes validated with ``context={"check_image_exists": False}``,
+    which only checks image formats. Existence checks run in worker threads,
+    at most ``max_concurrency`` at a time, through the shared stat cache.
+
+    Args:
+        recipes: The recipes to check; recipes without an image are skipped.
+        max_concurrency: Maximum number of filesystem checks in flight.
+        stat_cache: The cache to check through; defaults to ``image_stat_cache``.
+
+    Returns:
+        List[ImageProblem]: One entry per missing or wrongly formatted image,
+        in recipe order.
+
+    Raises:
+        ValueError: If max_concurrency is not positive.
+    """
+    if max_concurrency <= 0:
+        raise ValueError(
+            f"max_concurrency must be greater than 0. Got: {max_concurrency}"
+        )
+    cache = stat_cache if stat_cache is not None else image_stat_cache
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def check(recipe: "Recipe") -> Optional[ImageProblem]:
+        path = recipe.image_path
+        if not is_supported_image_format(path):
+            problem = "wrong_format"
+        else:
+            async with semaphore:
+                if await asyncio.to_thread(cache.is_file, path):
+                    return None
+            problem = "missing"
+        return ImageProblem(
+            recipe_id=recipe.recipe_id,
+            recipe_name=recipe.name,
+            image_path=path,
+            problem=problem,
+        )
+
+    results = await asyncio.gather(
+        *(check(recipe) for recipe in recipes if recipe.image_path is not None)
+    )
+    return [problem for problem in results if problem is not None]
@@ -0,0 +1,209 @@
+"""
+Indexed collection of kitchen inventory items.
+
+``Inventory`` keeps ``InventoryItem`` records indexed by id, by canonical
+ingredient name (see ``names.canonical_name``) and by storage location,
+together with a running total per ingredient in its aggregation unit (see
+``density.ingredient_unit``). Every index is updated incrementally as items
+are added or removed, so lookups never scan the whole inventory.
+"""
+
+import uuid
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from pint import Unit
+
+from density import ingredient_unit
+from fuzzy import TrigramIndex
+from model import InventoryItem
+from names import canonical_name, fold_text
+
+
+class Inventory:
+    """
+    A collection of inventory items with O(1) lookups by id, name and location.
+    """
+
+    def __init__(self, items: Iterable[InventoryItem] = ()):
+        self._by_id: Dict[str, InventoryItem] = {}
+        self._by_name: Dict[str, Dict[str, InventoryItem]] = {}
+        self._by_location: Dict[str, Dict[str, InventoryItem]] = {}
+        self._totals: Dict[str, Dict[Unit, float]] = {}
+        self._fuzzy = TrigramIndex()
+        for item in items:
+            self.add(item)
+
+    def add(self, item: InventoryItem) -> InventoryItem:
+        """
+        Adds an item, replacing any item with the same ``inventory_id``.
+
+        Items without an ``inventory_id`` are stored as a copy with a generated id.
+
+        Args:
+            item: The item to add.
+
+        Returns:
+            InventoryItem: The stored item.
+        """
+        if item.inventory_id is None:
+            item = item.model_copy(update={"inventory_id": uuid.uuid4().hex})
+        elif item.inventory_id in self._by_id:
+            self.remove(item.inventory_id)
+
+        self._by_id[item.inventory_id] = item
+        name = canonical_name(item.name)
+        if name not in self._by_name:
+            self._fuzzy.add(name)
+        self._by_name.setdefault(name, {})[item.inventory_id] = item
+        if item.storage_location is not None:
+            location = fold_text(item.storage_location)
+            self._by_location.setdefault(location, {})[item.inventory_id] = item
+        self._add_to_total(name, item)
+        return item
+
+    def remove(self, inventory_id: str) -> InventoryItem:
+        """
+        Removes an item by id.
+
+        Args:
+            inventory_id: The id of the item to remove.
+
+        Returns:
+            InventoryItem: The removed item.
+
+        Raises:
+            KeyError: If no item has this id.
+        """
+        item = self._by_id.pop(inventory_id)
+        name = canonical_name(item.name)
+        self._discard(self._by_name, name, inventory_id)
+        if name not in self._by_name:
+            self._fuzzy.discard(name)
+        if item.storage_location is not None:
+            location = fold_text(item.storage_location)
+            self._discard(self._by_location, location, inventory_id)
+        self._recompute_total(name)
+        return item
+
+    @staticmethod
+    def _discard(
+        index: Dict[str, Dict[str, InventoryItem]], key: str, item_id: str
+    ) -> None:
+        """Removes an item from a secondary index, dropping empty buckets."""
+        bucket = index[key]
+        del bucket[item_id]
+        if not bucket:
+            del index[key]
+
+    def _add_to_total(self, name: str, item: InventoryItem) -> None:
+        """Adds an item's quantity to its name's running totals."""
+        unit, factor = ingredient_unit(name, item.unit)
+        totals = self._totals.setdefault(name, {})
+        totals[unit] = totals.get(unit, 0.0) + item.quantity * factor
+
+    def _recompute_total(self, name: str) -> None:
+        """Rebuilds a name's totals from its remaining items, avoiding float drift."""
+        self._totals.pop(name, None)
+        for item in self._by_name.get(name, {}).values():
+            self._add_to_total(name, item)
+
+    def get(self, inventory_id: str) -> Optional[InventoryItem]:
+        """Returns the item with this id, or None."""
+        return self._by_id.get(inventory_id)
+
+    def find(self, name: str) -> List[InventoryItem]:
+        """
+        Returns every item of an ingredient, matched by canonical name.
+
+        Args:
+            name: The ingredient name, in any spelling.
+
+        Returns:
+            List[InventoryItem]: The matching items, in insertion order.
+        """
+        return list(self._by_name.get(canonical_name(name), {}).values())
+
+    def fuzzy_find(
+        self, query: str, limit: int = 5, threshold: float = 0.3
+    ) -> List[InventoryItem]:
+        """
+        Returns the items whose names best match a misspelled or partial name.
+
+        Args:
+            query: The text to match, e.g. "parmesan" for "Parmesan Cheese".
+            limit: The maximum number of distinct names to match.
+            threshold: The minimum trigram similarity, between 0 and 1.
+
+        Returns:
+            List[InventoryItem]: The items of the matching names, best match
+            first, then in insertion order.
+
+        Raises:
+            ValueError: If limit is not positive or threshold is outside [0, 1].
+        """
+        return [
+            item
+            for name, _ in self._fuzzy.search(query, limit, threshold)
+            for item in self._by_name[name].values()
+        ]
+
+    def in_location(self, location: str) -> List[InventoryItem]:
+        """
+        Returns every item stored in a location, matched case-insensitively.
+
+        Args:
+            location: The storage location, e.g. "Fridge".
+
+        Returns:
+            List[InventoryItem]: The matching items, in insertion order.
+        """
+        return list(self._by_location.get(fold_text(location), {}).values())
+
+    def names(self) -> List[str]:
+        """Returns the canonical names of every ingredient in stock."""
+        return list(self._by_name)
+
+    def __contains__(self, name: str) -> bool:
+        """Returns True if any item of this ingredient is in stock."""
+        return canonical_name(name) in self._by_name
+
+    def totals(self, name: str) -> Dict[Unit, float]:
+        """
+        Returns the aggregated quantity of an ingredient per aggregation unit.
+
+        Amounts are combined in the unit chosen by ``density.ingredient_unit``,
+        bridging mass, volume and counts where the ingredient's density or
+        piece weight is known. Amounts that cannot be bridged (e.g. grams and
+        pieces of an ingredient without a piece weight) get their own total.
+
+        Args:
+            name: The ingredient name, in any spelling.
+
+        Returns:
+            Dict[Unit, float]: Total quantity keyed by aggregation unit.
+        """
+        return dict(self._totals.get(canonical_name(name), {}))
+
+    def total(self, name: str, unit: Unit) -> float:
+        """
+        Returns the aggregated quantity of an ingredient expressed in ``unit``.
+
+        Only items convertible to ``unit``, directly or through the
+        ingredient's density or piece weight, are counted.
+
+        Args:
+            name: The ingredient name, in any spelling.
+            unit: The unit to express the total in.
+
+        Returns:
+            float: The total quantity, or 0.0 if none is in stock.
+        """
+        key = canonical_name(name)
+        base, factor = ingredient_unit(key, unit)
+        return self._totals.get(key, {}).get(base, 0.0) / factor
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[InventoryItem]:
+        return iter(list(self._by_id.values()))
@@ -1,13 +1,36 @@
-from pydantic import BaseModel, Field, field_validator
-from pydantic.types import FilePath
-from typing import List, Optional
-from pint import Unit, UnitRegistry, Quantity
+import math
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from pint import Unit, Quantity
 
-# Initialize Pint unit registry
-ureg = UnitRegistry()
+from images import (
+    ALLOWED_IMAGE_EXTENSIONS,
+    image_stat_cache,
+    is_supported_image_format,
+)
+from units import (
+    PintUnit,
+    check_kitchen_unit,
+    conversion_factor,
+    get_registry,
+    normalize_quantity,
+)
 
 
-class Ingredient(BaseModel, arbitrary_types_allowed=True):
+# Validation context that skips the image path checks of recipes whose images
+# were checked when they were written; see ``Recipe.load_without_image_checks``.
+SKIP_IMAGE_CHECKS_CONTEXT = {"skip_image_checks": True}
+
+
+def __getattr__(name: str):
+    """Exposes the lazily-built shared registry as ``model.ureg``."""
+    if name == "ureg":
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class Ingredient(BaseModel):
     """
     Represents a single ingredient required for a recipe, including quantity details.
 
@@ -24,14 +47,36 @@ class Ingredient(BaseModel, arbitrary_types_allowed=True):
     quantity: float = Field(
         ..., gt=0, description="The numerical amount of the ingredient."
     )
-    unit: Unit = Field(
+    unit: PintUnit = Field(
         ...,
-        description="The measurement unit (e.g., 'grams', 'ml', 'cups', 'teaspoons') as a Pint unit.",
+        description="The measurement unit (e.g., 'grams', 'ml', 'cups', 'teaspoons') as a Pint unit or unit string. Serialized to JSON as a short unit string.",
     )
 
+    @field_validator("unit")
+    @classmethod
+    def validate_kitchen_unit(cls, v: Unit, info: ValidationInfo) -> Unit:
+        """
+        Optionally restricts the unit to the compact kitchen registry.
+
+        Enabled by validating with ``context={"kitchen_units_only": True}``.
+
+        Args:
+            v: The unit to validate.
+            info: Validation info carrying the optional context.
+
+        Returns:
+            The validated unit.
+
+        Raises:
+            ValueError: If kitchen units are required and the unit is not one.
+        """
+        if info.context and info.context.get("kitchen_units_only"):
+            check_kitchen_unit(v)
+        return v
+
     def __str__(self) -> str:
         """Returns a human-readable representation of the ingredient."""
-        if self.unit == ureg.dimensionless:
+        if self.unit == get_registry().dimensionless:
             return f"{self.quantity} {self.name}"
         else:
             return f"{self.quantity} {self.unit} of {self.name}"
@@ -40,6 +85,38 @@ class Ingredient(BaseModel, arbitrary_types_allowed=True):
         """Returns a Pint Quantity object combining quantity and unit."""
         return self.quantity * self.unit
 
+    def quantity_in(self, unit: Unit) -> float:
+        """
+        Returns the ingredient amount expressed in another unit.
+
+        Uses the cached conversion-factor table instead of a Pint conversion.
+
+        Args:
+            unit: The target unit, which must be compatible with this ingredient's unit.
+
+        Returns:
+            float: The magnitude of this ingredient in ``unit``.
+
+        Raises:
+            DimensionalityError: If the units are not compatible.
+        """
+        return self.quantity * conversion_factor(self.unit, unit)
+
+    def to(self, unit: Unit) -> Quantity:
+        """
+        Returns the ingredient as a Pint Quantity converted to another unit.
+
+        Args:
+            unit: The target unit, which must be compatible with this ingredient's unit.
+
+        Returns:
+            Quantity: The converted quantity.
+
+        Raises:
+            DimensionalityError: If the units are not compatible.
+        """
+        return self.quantity_in(unit) * unit
+
 
 class Step(BaseModel):
     """
@@ -79,36 +156,74 @@ class Recipe(BaseModel):
     cook_time_minutes: Optional[int] = Field(
         None, ge=0, description="Estimated cooking time in minutes."
     )
-    image_path: Optional[FilePath] = Field(
-        None, description="Path to an image file for the recipe."
+    image_path: Optional[Path] = Field(
+        None, description="Path to an existing image file for the recipe."
     )
 
     @field_validator("image_path")
     @classmethod
-    def validate_image_format(cls, v: Optional[FilePath]) -> Optional[FilePath]:
+    def validate_image_format(
+        cls, v: Optional[Path], info: ValidationInfo
+    ) -> Optional[Path]:
         """
-        Validates that the image path points to a JPEG, PNG, or WebP file.
+        Validates that the image path points to an existing JPEG, PNG, or WebP file.
+
+        Existence checks go through the shared TTL ``image_stat_cache``. When
+        validating with ``context={"image_verifier": verifier}``, they are
+        instead queued on that ``BackgroundImageVerifier``; with
+        ``context={"check_image_exists": False}`` only the format is checked,
+        e.g. before verifying a batch with ``images.verify_recipe_images``.
+        Both checks are skipped with ``SKIP_IMAGE_CHECKS_CONTEXT``.
 
         Args:
             v: The file path to validate, or None.
+            info: Validation info carrying the optional context.
 
         Returns:
             The validated file path, or None.
 
         Raises:
-            ValueError: If the file extension is not .jpg, .jpeg, .png, or .webp.
+            ValueError: If the file extension is not .jpg, .jpeg, .png, or .webp,
+                or if the path does not point to a file.
         """
-        if v is not None:
-            allowed_extensions = {".jpg", ".jpeg", ".png", ".webp"}
-            file_extension = v.suffix.lower()
-            if file_extension not in allowed_extensions:
-                raise ValueError(
-                    f"Image file must be one of types: {allowed_extensions=}. Got: {file_extension}"
-                )
-            if not v.exists():
-                raise FileNotFoundError(f"Image file does not exist: {v}")
+        context = info.context or {}
+        if v is None or context.get("skip_image_checks"):
+            return v
+        if not is_supported_image_format(v):
+            raise ValueError(
+                f"Image file must be one of types: {ALLOWED_IMAGE_EXTENSIONS=}. Got: {v.suffix.lower()}"
+            )
+        verifier = context.get("image_verifier")
+        if verifier is not None:
+            verifier.submit(v)
+        elif context.get("check_image_exists", True) and not image_stat_cache.is_file(
+            v
+        ):
+            raise ValueError(f"Image file does not exist: {v}")
         return v
 
+    @classmethod
+    def load_without_image_checks(
+        cls, data: Union["Recipe", Dict[str, Any]]
+    ) -> "Recipe":
+        """
+        Validates a recipe whose image was checked when it was written.
+
+        Every field is validated as usual, except that the image path is
+        neither format-checked nor looked up on the filesystem, which is the
+        expensive part of loading recipes with images.
+
+        Args:
+            data: An existing recipe or a dict of field values.
+
+        Returns:
+            Recipe: The validated recipe.
+
+        Raises:
+            ValidationError: If any other field is invalid.
+        """
+        return cls.model_validate(data, context=SKIP_IMAGE_CHECKS_CONTEXT)
+
     def get_total_time(self) -> int:
         """
         Calculates the total time required for the recipe (prep + cook).
@@ -120,6 +235,42 @@ class Recipe(BaseModel):
         cook = self.cook_time_minutes if self.cook_time_minutes is not None else 0
         return prep + cook
 
+    def scale(self, factor: float, normalize: bool = False) -> "Recipe":
+        """
+        Returns a copy of the recipe with every ingredient quantity scaled.
+
+        The copy is validated in one pass from plain ingredient data, which
+        pydantic-core does faster than copying each ingredient model in
+        Python; the image path is not checked again.
+
+        Args:
+            factor: The positive scaling factor (e.g. 2 to double the recipe).
+            normalize: If True, re-express each quantity in the most readable
+                unit of its family (e.g. 1500 g becomes 1.5 kg).
+
+        Returns:
+            Recipe: The scaled recipe, sharing no lists with the original.
+
+        Raises:
+            ValueError: If the factor is not a finite number greater than 0.
+        """
+        if not (math.isfinite(factor) and factor > 0):
+            raise ValueError(
+                f"Scaling factor must be a finite number greater than 0. Got: {factor}"
+            )
+        ingredients = []
+        for ingredient in self.ingredients:
+            quantity, unit = ingredient.quantity * factor, ingredient.unit
+            if normalize:
+                quantity, unit = normalize_quantity(quantity, unit)
+            ingredients.append(
+                {"name": ingredient.name, "quantity": quantity, "unit": unit}
+            )
+        return Recipe.model_validate(
+            {**self.__dict__, "ingredients": ingredients, "steps": list(self.steps)},
+            context=SKIP_IMAGE_CHECKS_CONTEXT,
+        )
+
 
 class InventoryItem(Ingredient):
     """
@@ -0,0 +1,108 @@
+"""
+Canonical keys for free-text ingredient names.
+
+Recipes and inventory spell the same ingredient in many ways ("Olive Oil",
+"olive oil ", "Olive oils"). ``canonical_name`` maps each spelling to one
+lookup key by case folding, collapsing whitespace and hyphens, stemming the
+last word's plural and resolving ``NAME_ALIASES``. Keys are interned and
+cached per raw name, so indexes compare and hash them cheaply.
+"""
+
+import sys
+from functools import lru_cache
+
+# Synonyms mapped to the key used in their place, after stemming.
+NAME_ALIASES = {
+    "all purpose flour": "flour",
+    "plain flour": "flour",
+    "aubergine": "eggplant",
+    "courgette": "zucchini",
+    "cilantro": "coriander",
+    "scallion": "green onion",
+    "spring onion": "green onion",
+    "garbanzo bean": "chickpea",
+    "powdered sugar": "icing sugar",
+    "confectioners sugar": "icing sugar",
+    "caster sugar": "superfine sugar",
+    "bicarbonate of soda": "baking soda",
+    "capsicum": "bell pepper",
+    "prawn": "shrimp",
+}
+
+# Plurals that the suffix rules would get wrong.
+IRREGULAR_PLURALS = {
+    "leaves": "leaf",
+    "loaves": "loaf",
+    "halves": "half",
+    "knives": "knife",
+    "teeth": "tooth",
+    "geese": "goose",
+    "mice": "mouse",
+}
+
+# Words that end like a plural but are not one.
+UNCOUNTABLE_WORDS = frozenset(
+    {"molasses", "swiss", "hummus", "couscous", "asparagus", "citrus", "series"}
+)
+
+# Maximum number of distinct raw names kept by the canonicalization cache.
+NAME_CACHE_SIZE = 4096
+
+
+def fold_text(text: str) -> str:
+    """
+    Case-folds text and collapses runs of whitespace into single spaces.
+
+    Args:
+        text: The free text, e.g. " Olive  Oil".
+
+    Returns:
+        str: The folded text, e.g. "olive oil".
+    """
+    return " ".join(text.casefold().split())
+
+
+def singularize(word: str) -> str:
+    """
+    Returns the singular of an English noun using simple suffix rules.
+
+    Args:
+        word: A lower-case word, e.g. "tomatoes" or "berries".
+
+    Returns:
+        str: The singular form, e.g. "tomato" or "berry"; unknown or short
+        words are returned unchanged.
+    """
+    if word in IRREGULAR_PLURALS:
+        return IRREGULAR_PLURALS[word]
+    if len(word) <= 3 or word in UNCOUNTABLE_WORDS:
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith(("oes", "ches", "shes", "sses", "xes", "zes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def canonical_name(name: str) -> str:
+    """
+    Returns the canonical lookup key for an ingredient name.
+
+    The name is case-folded, hyphens and runs of whitespace become single
+    spaces, the last word is singularized and ``NAME_ALIASES`` is applied.
+    Results are interned and kept in a bounded LRU cache, whose hit and miss
+    counters are available from ``canonical_name.cache_info()``.
+
+    Args:
+        name: The free-text name, e.g. "Olive  Oils" or "Spring onions".
+
+    Returns:
+        str: The canonical key, e.g. "olive oil" or "green onion".
+    """
+    words = fold_text(name.replace("-", " ")).split(" ")
+    words[-1] = singularize(words[-1])
+    key = " ".join(words)
+    return sys.intern(NAME_ALIASES.get(key, key))
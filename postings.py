@@ -0,0 +1,310 @@
+"""
+Persistent inverted index from canonical ingredient name to recipes.
+
+``IngredientPostings`` numbers recipes densely and keeps, for every canonical
+ingredient name (see ``names.canonical_name``), a sorted ``array("I")`` of the
+numbers of the recipes using it. "Recipes with chicken and lemon but no cream"
+is then an intersection of the shortest posting lists followed by exclusion
+checks, all by binary search, without looking at any recipe's ingredients.
+
+On disk, posting lists are delta-encoded as unsigned LEB128 varints, so dense
+lists take about one byte per entry.
+"""
+
+import os
+import sys
+from array import array
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from model import Recipe
+from names import canonical_name
+
+# Identifies the file format and its version.
+_MAGIC = b"APPETISE-POSTINGS\x01"
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Appends a non-negative integer as an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """Reads a varint at ``position``; returns its value and the next position."""
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Posting data ended inside a varint.")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def encode_postings(postings: Iterable[int]) -> bytes:
+    """
+    Delta-encodes a sorted posting list as varints.
+
+    Args:
+        postings: Strictly increasing non-negative integers.
+
+    Returns:
+        bytes: The number of entries followed by the gaps between them.
+
+    Raises:
+        ValueError: If the postings are not strictly increasing.
+    """
+    values = list(postings)
+    out = bytearray()
+    _write_varint(out, len(values))
+    previous = -1
+    for value in values:
+        if value <= previous:
+            raise ValueError("Postings must be strictly increasing.")
+        _write_varint(out, value - previous - 1)
+        previous = value
+    return bytes(out)
+
+
+def decode_postings(data: bytes, position: int = 0) -> Tuple[array, int]:
+    """
+    Decodes a posting list written by ``encode_postings``.
+
+    Args:
+        data: The encoded bytes.
+        position: Where the posting list starts in ``data``.
+
+    Returns:
+        Tuple[array, int]: The postings as ``array("I")`` and the position
+        after them.
+
+    Raises:
+        ValueError: If the data is truncated.
+    """
+    count, position = _read_varint(data, position)
+    postings = array("I")
+    previous = -1
+    for _ in range(count):
+        gap, position = _read_varint(data, position)
+        previous += gap + 1
+        postings.append(previous)
+    return postings, position
+
+
+def _intersect(left: array, right: array) -> array:
+    """Intersects two sorted arrays by binary searching the shorter in the longer."""
+    if len(left) > len(right):
+        left, right = right, left
+    result = array("I")
+    low = 0
+    for value in left:
+        low = bisect_left(right, value, low)
+        if low == len(right):
+            break
+        if right[low] == value:
+            result.append(value)
+    return result
+
+
+def _contains(postings: array, value: int) -> bool:
+    """Returns whether a sorted array holds ``value``."""
+    index = bisect_left(postings, value)
+    return index < len(postings) and postings[index] == value
+
+
+class IngredientPostings:
+    """
+    An inverted index of recipe ids by canonical ingredient name.
+    """
+
+    def __init__(self, recipes: Iterable[Recipe] = ()):
+        self._recipe_ids: List[Optional[str]] = []
+        self._numbers: Dict[str, int] = {}
+        self._names: Dict[int, Tuple[str, ...]] = {}
+        self._postings: Dict[str, array] = {}
+        for recipe in recipes:
+            self.add(recipe)
+
+    def add(self, recipe: Recipe) -> None:
+        """
+        Indexes a recipe's ingredient names, replacing any earlier version.
+
+        Args:
+            recipe: The recipe to index.
+
+        Raises:
+            ValueError: If the recipe has no recipe_id.
+        """
+        if recipe.recipe_id is None:
+            raise ValueError(f"Recipe '{recipe.name}' has no recipe_id to index.")
+        names = tuple(dict.fromkeys(canonical_name(i.name) for i in recipe.ingredients))
+        self._index(recipe.recipe_id, names)
+
+    def _index(self, recipe_id: str, names: Tuple[str, ...]) -> None:
+        """Adds the postings of one recipe, reusing its number if it has one."""
+        number = self._numbers.get(recipe_id)
+        if number is None:
+            number = self._numbers[recipe_id] = len(self._recipe_ids)
+            self._recipe_ids.append(recipe_id)
+        else:
+            self._unindex(number)
+        self._names[number] = names
+        for name in names:
+            postings = self._postings.setdefault(name, array("I"))
+            if not postings or postings[-1] < number:
+                postings.append(number)
+            else:
+                insort(postings, number)
+
+    def _unindex(self, number: int) -> None:
+        """Removes a recipe number from the posting lists of its names."""
+        for name in self._names.pop(number, ()):
+            postings = self._postings[name]
+            del postings[bisect_left(postings, number)]
+            if not postings:
+                del self._postings[name]
+
+    def remove(self, recipe_id: str) -> None:
+        """
+        Removes a recipe from the index.
+
+        Args:
+            recipe_id: The id of the recipe to remove.
+
+        Raises:
+            KeyError: If no recipe with this id is indexed.
+        """
+        number = self._numbers.pop(recipe_id)
+        self._unindex(number)
+        self._recipe_ids[number] = None
+
+    def __contains__(self, recipe_id: str) -> bool:
+        return recipe_id in self._numbers
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def postings(self, name: str) -> array:
+        """
+        Returns the sorted recipe numbers of an ingredient.
+
+        Args:
+            name: The ingredient name, in any spelling.
+
+        Returns:
+            array: A copy of the posting list; empty if no recipe uses it.
+        """
+        return array("I", self._postings.get(canonical_name(name), ()))
+
+    def query(
+        self, include: Iterable[str] = (), exclude: Iterable[str] = ()
+    ) -> List[str]:
+        """
+        Returns the recipes using every included and no excluded ingredient.
+
+        Included posting lists are intersected shortest first; candidates are
+        then dropped if any excluded posting list contains them.
+
+        Args:
+            include: Ingredient names, in any spelling, that must all be used.
+            exclude: Ingredient names, in any spelling, that must not be used.
+
+        Returns:
+            List[str]: The matching recipe ids, in indexing order.
+        """
+        included = {canonical_name(name) for name in include}
+        excluded = [
+            self._postings[name]
+            for name in {canonical_name(name) for name in exclude}
+            if name in self._postings
+        ]
+        if included:
+            lists = sorted(
+                (self._postings.get(name, array("I")) for name in included), key=len
+            )
+            candidates = lists[0]
+            for postings in lists[1:]:
+                if not candidates:
+                    break
+                candidates = _intersect(candidates, postings)
+        else:
+            candidates = (n for n, r in enumerate(self._recipe_ids) if r is not None)
+        return [
+            self._recipe_ids[number]
+            for number in candidates
+            if not any(_contains(postings, number) for postings in excluded)
+        ]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Writes the index to a file, replacing it atomically.
+
+        Recipe numbers are compacted, so removed recipes take no space.
+
+        Args:
+            path: The file to write.
+        """
+        live = [(n, r) for n, r in enumerate(self._recipe_ids) if r is not None]
+        renumber = {old: new for new, (old, _) in enumerate(live)}
+        out = bytearray(_MAGIC)
+        _write_varint(out, len(live))
+        for _, recipe_id in live:
+            encoded = recipe_id.encode()
+            _write_varint(out, len(encoded))
+            out += encoded
+        _write_varint(out, len(self._postings))
+        for name, postings in self._postings.items():
+            encoded = name.encode()
+            _write_varint(out, len(encoded))
+            out += encoded
+            out += encode_postings(renumber[number] for number in postings)
+        path = Path(path)
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_bytes(out)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IngredientPostings":
+        """
+        Reads an index written by ``save``.
+
+        Args:
+            path: The file to read.
+
+        Returns:
+            IngredientPostings: The loaded index.
+
+        Raises:
+            ValueError: If the file is not a posting index or is truncated.
+        """
+        data = Path(path).read_bytes()
+        if not data.startswith(_MAGIC):
+            raise ValueError(f"Not an ingredient posting index: {path}")
+        position = len(_MAGIC)
+        index = cls()
+        count, position = _read_varint(data, position)
+        for number in range(count):
+            length, position = _read_varint(data, position)
+            recipe_id = data[position : position + length].decode()
+            position += length
+            index._recipe_ids.append(recipe_id)
+            index._numbers[recipe_id] = number
+        names: Dict[int, List[str]] = {}
+        count, position = _read_varint(data, position)
+        for _ in range(count):
+            length, position = _read_varint(data, position)
+            name = sys.intern(data[position : position + length].decode())
+            position += length
+            postings, position = decode_postings(data, position)
+            index._postings[name] = postings
+            for number in postings:
+                names.setdefault(number, []).append(name)
+        index._names = {number: tuple(n) for number, n in names.items()}
+        return index
@@ -0,0 +1,146 @@
+"""
+Import, export and bulk validation of recipes.
+
+Recipe dumps can be several gigabytes, so recipes are streamed one line at a
+time instead of being loaded into a list. Files ending in ``.gz`` are read
+and written with gzip compression. In-memory batches of raw records are
+validated with ``validate_recipes``.
+"""
+
+import gzip
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from pydantic import BaseModel, Field, ValidationError
+
+from model import SKIP_IMAGE_CHECKS_CONTEXT, Recipe
+
+
+class RecordError(BaseModel):
+    """
+    Describes an input record that failed validation during a bulk import.
+    """
+
+    position: int = Field(
+        ...,
+        ge=0,
+        description=(
+            "Where the record was found: the 1-based line number for files, "
+            "or the 0-based index for in-memory sequences."
+        ),
+    )
+    message: str = Field(..., description="The validation error message.")
+
+
+def _open_binary(path: Union[str, Path], mode: str) -> IO[bytes]:
+    """Opens a file in binary mode, using gzip for paths ending in '.gz'."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "b")
+    return open(path, mode + "b")
+
+
+def iter_recipes_jsonl(
+    path: Union[str, Path],
+    errors: Optional[List[RecordError]] = None,
+    skip_image_checks: bool = False,
+) -> Iterator[Recipe]:
+    """
+    Streams validated recipes from a JSON Lines file, one line at a time.
+
+    Lines that fail to parse or validate do not abort the import: they are
+    skipped and, if ``errors`` is given, reported there. Blank lines are ignored.
+
+    Args:
+        path: The .jsonl file to read; '.gz' files are decompressed on the fly.
+        errors: Optional list that receives a RecordError for each bad line.
+        skip_image_checks: If True, load with ``SKIP_IMAGE_CHECKS_CONTEXT`` for
+            dumps whose images were checked when they were written.
+
+    Yields:
+        Recipe: Each valid recipe, in file order.
+    """
+    context = SKIP_IMAGE_CHECKS_CONTEXT if skip_image_checks else None
+    with _open_binary(path, "r") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield Recipe.model_validate_json(line, context=context)
+            except ValidationError as e:
+                if errors is not None:
+                    errors.append(RecordError(position=line_number, message=str(e)))
+
+
+def write_recipes_jsonl(recipes: Iterable[Recipe], path: Union[str, Path]) -> int:
+    """
+    Streams recipes to a JSON Lines file, one recipe per line.
+
+    Args:
+        recipes: The recipes to write; consumed lazily.
+        path: The .jsonl file to write; '.gz' files are gzip-compressed.
+
+    Returns:
+        int: The number of recipes written.
+    """
+    count = 0
+    with _open_binary(path, "w") as file:
+        for recipe in recipes:
+            file.write(recipe.model_dump_json().encode())
+            file.write(b"\n")
+            count += 1
+    return count
+
+
+# A raw recipe record: a JSON document or a dict with unit strings.
+RawRecipe = Union[str, bytes, Dict[str, Any]]
+
+
+class BulkValidationResult(BaseModel):
+    """
+    The outcome of validating a batch of raw recipe records.
+    """
+
+    recipes: List[Recipe] = Field(
+        default_factory=list, description="The valid recipes, in input order."
+    )
+    errors: List[RecordError] = Field(
+        default_factory=list, description="One entry per record that failed validation."
+    )
+
+
+def validate_recipes(records: Iterable[RawRecipe]) -> BulkValidationResult:
+    """
+    Validates raw recipe records, collecting errors instead of raising.
+
+    Records are validated in the calling process. Handing them to worker
+    processes does not pay off: the parent has to unpickle every returned
+    model, which costs as much as validating the record in the first place.
+
+    Args:
+        records: JSON documents (str or bytes) or dicts using unit strings.
+
+    Returns:
+        BulkValidationResult: The valid recipes in input order and an error
+        entry, with its input index, for every invalid record.
+    """
+    result = BulkValidationResult()
+    for index, record in enumerate(records):
+        try:
+            if isinstance(record, (str, bytes)):
+                recipe = Recipe.model_validate_json(record)
+            else:
+                recipe = Recipe.model_validate(record)
+        except ValidationError as e:
+            result.errors.append(RecordError(position=index, message=str(e)))
+        else:
+            result.recipes.append(recipe)
+    return result
@@ -0,0 +1,233 @@
+"""
+Full-text search over recipe names, descriptions and steps.
+
+``RecipeSearchIndex`` is an in-memory inverted index from term to the recipes
+containing it, ranked with Okapi BM25. Recipes can be added, replaced and
+removed at any time; only their own postings are touched. Queries are plain
+words; a word prefixed with "-", "no" or "without" excludes recipes that
+contain it, so "braise -wine" and "no oven" both work.
+
+``RecipeStore.search_recipes`` offers the same query syntax backed by SQLite
+FTS5, for catalogues that live in the store.
+"""
+
+import heapq
+import math
+import re
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from model import Recipe
+from names import singularize
+
+# Words too common to help ranking.
+STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "then",
+        "to",
+        "until",
+        "with",
+    }
+)
+
+# Query words that exclude the word following them.
+NEGATION_WORDS = frozenset({"no", "without"})
+
+# Recipe names count this many times, so title matches rank first.
+NAME_WEIGHT = 2
+
+# BM25 term frequency saturation and length normalization parameters.
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into search terms.
+
+    Words are case-folded and singularized; stop words are dropped.
+
+    Args:
+        text: The free text, e.g. "Braise the onions".
+
+    Returns:
+        List[str]: The terms in order, e.g. ["braise", "onion"].
+    """
+    return [
+        singularize(word)
+        for word in _WORD.findall(text.casefold())
+        if word not in STOP_WORDS
+    ]
+
+
+def parse_query(query: str) -> Tuple[List[str], List[str]]:
+    """
+    Splits a query into terms to match and terms to exclude.
+
+    Args:
+        query: The query, e.g. "braised beef no oven -wine".
+
+    Returns:
+        Tuple[List[str], List[str]]: The included and the excluded terms.
+    """
+    included: List[str] = []
+    excluded: List[str] = []
+    negate_next = False
+    for word in query.split():
+        if word.casefold() in NEGATION_WORDS:
+            negate_next = True
+            continue
+        target = excluded if negate_next or word.startswith("-") else included
+        target.extend(tokenize(word))
+        negate_next = False
+    return included, excluded
+
+
+def recipe_text_terms(recipe: Recipe) -> List[str]:
+    """
+    Returns the search terms of a recipe's name, description and steps.
+
+    Args:
+        recipe: The recipe.
+
+    Returns:
+        List[str]: The terms, with the name's terms repeated ``NAME_WEIGHT`` times.
+    """
+    terms = tokenize(recipe.name) * NAME_WEIGHT
+    if recipe.description:
+        terms.extend(tokenize(recipe.description))
+    for step in recipe.steps:
+        terms.extend(tokenize(step.description))
+    return terms
+
+
+class RecipeSearchIndex:
+    """
+    An incremental BM25 full-text index of recipes, keyed by ``recipe_id``.
+    """
+
+    def __init__(self, recipes: Iterable[Recipe] = ()):
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._terms: Dict[str, FrozenSet[str]] = {}
+        self._total_length = 0
+        for recipe in recipes:
+            self.add(recipe)
+
+    def add(self, recipe: Recipe) -> None:
+        """
+        Indexes a recipe, replacing any recipe with the same ``recipe_id``.
+
+        Args:
+            recipe: The recipe to index.
+
+        Raises:
+            ValueError: If the recipe has no recipe_id.
+        """
+        if recipe.recipe_id is None:
+            raise ValueError(f"Recipe '{recipe.name}' has no recipe_id to index.")
+        if recipe.recipe_id in self._lengths:
+            self.remove(recipe.recipe_id)
+        terms = recipe_text_terms(recipe)
+        for term in terms:
+            documents = self._postings.setdefault(term, {})
+            documents[recipe.recipe_id] = documents.get(recipe.recipe_id, 0) + 1
+        self._lengths[recipe.recipe_id] = len(terms)
+        self._terms[recipe.recipe_id] = frozenset(terms)
+        self._total_length += len(terms)
+
+    def remove(self, recipe_id: str) -> None:
+        """
+        Removes a recipe from the index.
+
+        Only the postings of the recipe's own terms are visited.
+
+        Args:
+            recipe_id: The id of the recipe to remove.
+
+        Raises:
+            KeyError: If no recipe with this id is indexed.
+        """
+        self._total_length -= self._lengths.pop(recipe_id)
+        for term in self._terms.pop(recipe_id):
+            documents = self._postings[term]
+            del documents[recipe_id]
+            if not documents:
+                del self._postings[term]
+
+    def __contains__(self, recipe_id: str) -> bool:
+        return recipe_id in self._lengths
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def _matching(self, terms: Iterable[str]) -> Set[str]:
+        """Returns the ids of the recipes containing any of the terms."""
+        matches: Set[str] = set()
+        for term in terms:
+            matches.update(self._postings.get(term, ()))
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Returns the recipes best matching a query, ranked with BM25.
+
+        Recipes match if they contain any included term and no excluded
+        term. A query with only exclusions returns every other recipe with a
+        score of 0, ordered by recipe_id.
+
+        Args:
+            query: The query, e.g. "braise" or "quick pasta no oven".
+            limit: The maximum number of results.
+
+        Returns:
+            List[Tuple[str, float]]: (recipe_id, score) pairs, best first.
+
+        Raises:
+            ValueError: If limit is not positive.
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be greater than 0. Got: {limit}")
+        included, excluded = parse_query(query)
+        rejected = self._matching(excluded)
+        if not included:
+            return [
+                (recipe_id, 0.0)
+                for recipe_id in heapq.nsmallest(limit, self._lengths.keys() - rejected)
+            ]
+        count = len(self._lengths)
+        average_length = self._total_length / count if count else 0.0
+        scores: Dict[str, float] = {}
+        for term in set(included):
+            documents = self._postings.get(term)
+            if not documents:
+                continue
+            idf = math.log(1 + (count - len(documents) + 0.5) / (len(documents) + 0.5))
+            for recipe_id, frequency in documents.items():
+                if recipe_id in rejected:
+                    continue
+                norm = 1 - BM25_B + BM25_B * self._lengths[recipe_id] / average_length
+                scores[recipe_id] = scores.get(recipe_id, 0.0) + idf * (
+                    frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * norm)
+                )
+        return heapq.nsmallest(limit, scores.items(), key=lambda hit: (-hit[1], hit[0]))
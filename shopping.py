@@ -0,0 +1,91 @@
+"""
+Consolidated shopping lists for a set of planned recipes.
+
+Ingredients are aggregated in a single pass, keyed by canonical name
+(``names.canonical_name``) and aggregation unit (``density.ingredient_unit``),
+so compatible amounts such as cups and milliliters add up, as do cups and
+grams of flour or pieces and grams of eggs. Amounts that cannot be bridged
+stay separate lines. Current stock is then subtracted and the remaining
+amounts are re-expressed in readable units.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pint import Unit
+
+from density import ingredient_unit
+from inventory import Inventory
+from model import Ingredient, Recipe
+from names import canonical_name
+from units import normalize_quantity
+
+# Amounts below this fraction of the requirement are treated as covered.
+_TOLERANCE = 1e-9
+
+
+def aggregate_ingredients(
+    recipes: Iterable[Recipe],
+) -> Dict[Tuple[str, Unit], float]:
+    """
+    Sums the ingredients of several recipes per canonical name and aggregation unit.
+
+    Args:
+        recipes: The planned recipes; a recipe listed twice is counted twice.
+
+    Returns:
+        Dict[Tuple[str, Unit], float]: The total amount keyed by
+        (canonical name, aggregation unit).
+    """
+    totals: Dict[Tuple[str, Unit], float] = {}
+    for recipe in recipes:
+        for ingredient in recipe.ingredients:
+            name = canonical_name(ingredient.name)
+            unit, factor = ingredient_unit(name, ingredient.unit)
+            key = (name, unit)
+            totals[key] = totals.get(key, 0.0) + ingredient.quantity * factor
+    return totals
+
+
+def shopping_list(
+    recipes: Iterable[Recipe], inventory: Optional[Inventory] = None
+) -> List[Ingredient]:
+    """
+    Builds the list of ingredients to buy to cook all of the given recipes.
+
+    Args:
+        recipes: The planned recipes; a recipe listed twice is counted twice.
+        inventory: The current stock to subtract, if any.
+
+    Returns:
+        List[Ingredient]: One entry per ingredient and dimensionality still
+        needed, in readable units, sorted by name. Names use the spelling of
+        their first occurrence.
+    """
+    recipes = list(recipes)
+    display_names: Dict[str, str] = {}
+    for recipe in recipes:
+        for ingredient in recipe.ingredients:
+            display_names.setdefault(
+                canonical_name(ingredient.name), " ".join(ingredient.name.split())
+            )
+    items = []
+    for (name, unit), amount in sorted(
+        aggregate_ingredients(recipes).items(), key=lambda entry: entry[0][0]
+    ):
+        if inventory is not None:
+            needed = amount - inventory.totals(name).get(unit, 0.0)
+        else:
+            needed = amount
+        if needed <= amount * _TOLERANCE:
+            continue
+        quantity, readable_unit = normalize_quantity(needed, unit)
+        items.append(
+            Ingredient.model_validate(
+                {
+                    "name": display_names[name],
+                    "quantity": quantity,
+                    "unit": readable_unit,
+                }
+            )
+        )
+    return items
@@ -0,0 +1,552 @@
+"""
+SQLite persistence for recipes and inventory.
+
+Recipes, their ingredients and steps, and inventory items are stored in
+normalized tables keyed by ``recipe_id`` and ``inventory_id``. Writes are
+batched inside transactions, and the database runs in WAL mode so readers in
+other connections are not blocked by a writer. Ingredient and inventory rows
+also store the canonical name (``names.canonical_name``), which name lookups
+use. Rows
+were validated before they were written, so recipes are loaded back without
+re-checking their images.
+"""
+
+import sqlite3
+from itertools import groupby, islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from model import InventoryItem, Recipe
+from names import canonical_name
+from search import NAME_WEIGHT, parse_query
+from units import format_unit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recipes (
+    recipe_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    prep_time_minutes INTEGER,
+    cook_time_minutes INTEGER,
+    image_path TEXT
+);
+CREATE TABLE IF NOT EXISTS recipe_ingredients (
+    recipe_id TEXT NOT NULL REFERENCES recipes (recipe_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    quantity REAL NOT NULL,
+    unit TEXT NOT NULL,
+    name_key TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (recipe_id, position)
+);
+CREATE TABLE IF NOT EXISTS recipe_steps (
+    recipe_id TEXT NOT NULL REFERENCES recipes (recipe_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    PRIMARY KEY (recipe_id, position)
+);
+CREATE TABLE IF NOT EXISTS inventory (
+    inventory_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    quantity REAL NOT NULL,
+    unit TEXT NOT NULL,
+    storage_location TEXT,
+    name_key TEXT NOT NULL DEFAULT ''
+);
+"""
+
+# Created after _migrate, as older databases lack the indexed columns.
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_name_key
+    ON recipe_ingredients (name_key);
+CREATE INDEX IF NOT EXISTS idx_inventory_name_key ON inventory (name_key);
+"""
+
+# Tables holding a canonical name column, with the raw-name index it replaces.
+_NAME_KEY_TABLES = (
+    ("recipe_ingredients", "idx_recipe_ingredients_name"),
+    ("inventory", "idx_inventory_name"),
+)
+
+# Full-text table whose rowids mirror those of the recipes table.
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE recipe_search USING fts5(
+    name, description, steps, tokenize = 'porter unicode61'
+);
+INSERT INTO recipe_search (rowid, name, description, steps)
+SELECT rowid, name, description, (
+    SELECT group_concat(description, ' ') FROM (
+        SELECT description FROM recipe_steps
+        WHERE recipe_steps.recipe_id = recipes.recipe_id ORDER BY position
+    )
+) FROM recipes;
+"""
+
+_RECIPE_COLUMNS = (
+    "recipe_id, name, description, prep_time_minutes, cook_time_minutes, image_path"
+)
+_INVENTORY_COLUMNS = "inventory_id, name, quantity, unit, storage_location"
+
+
+class RecipeStore:
+    """
+    A SQLite-backed store of recipes and inventory items.
+
+    Can be used as a context manager, which closes the connection on exit.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+        self._migrate()
+        self._connection.executescript(_INDEXES)
+        self._full_text = self._create_search_table()
+
+    def _migrate(self) -> None:
+        """Adds and backfills the canonical name columns in older databases."""
+        self._connection.create_function(
+            "canonical_name", 1, canonical_name, deterministic=True
+        )
+        for table, raw_name_index in _NAME_KEY_TABLES:
+            columns = {
+                row["name"]
+                for row in self._connection.execute(f"PRAGMA table_info({table})")
+            }
+            if "name_key" in columns:
+                continue
+            with self._connection:
+                self._connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN name_key TEXT NOT NULL DEFAULT ''"
+                )
+                self._connection.execute(
+                    f"UPDATE {table} SET name_key = canonical_name(name)"
+                )
+                self._connection.execute(f"DROP INDEX IF EXISTS {raw_name_index}")
+
+    def _create_search_table(self) -> bool:
+        """Creates and fills the full-text table if needed; False without FTS5."""
+        exists = self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'recipe_search'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            self._connection.executescript(f"BEGIN; {_SEARCH_SCHEMA} COMMIT;")
+        except sqlite3.OperationalError:
+            self._connection.rollback()
+            return False
+        return True
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "RecipeStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Recipes
+
+    def add_recipes(self, recipes: Iterable[Recipe], batch_size: int = 1000) -> int:
+        """
+        Inserts or replaces recipes, one transaction per batch.
+
+        Args:
+            recipes: The recipes to store; each must have a ``recipe_id``.
+            batch_size: Number of recipes written per transaction.
+
+        Returns:
+            int: The number of recipes written.
+
+        Raises:
+            ValueError: If a recipe has no recipe_id or batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be greater than 0. Got: {batch_size}")
+        iterator = iter(recipes)
+        count = 0
+        while batch := list(islice(iterator, batch_size)):
+            self._write_recipe_batch(batch)
+            count += len(batch)
+        return count
+
+    def add_recipe(self, recipe: Recipe) -> None:
+        """
+        Inserts or replaces a single recipe.
+
+        Args:
+            recipe: The recipe to store; must have a ``recipe_id``.
+        """
+        self.add_recipes([recipe])
+
+    def _write_recipe_batch(self, recipes: List[Recipe]) -> None:
+        """Writes one batch of recipes and their children in a single transaction."""
+        for recipe in recipes:
+            if recipe.recipe_id is None:
+                raise ValueError(f"Recipe '{recipe.name}' has no recipe_id to store.")
+        ids = [(recipe.recipe_id,) for recipe in recipes]
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT INTO recipes ({_RECIPE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (recipe_id) DO UPDATE SET name = excluded.name, "
+                "description = excluded.description, "
+                "prep_time_minutes = excluded.prep_time_minutes, "
+                "cook_time_minutes = excluded.cook_time_minutes, "
+                "image_path = excluded.image_path",
+                [
+                    (
+                        recipe.recipe_id,
+                        recipe.name,
+                        recipe.description,
+                        recipe.prep_time_minutes,
+                        recipe.cook_time_minutes,
+                        str(recipe.image_path) if recipe.image_path else None,
+                    )
+                    for recipe in recipes
+                ],
+            )
+            if self._full_text:
+                self._connection.executemany(
+                    "DELETE FROM recipe_search WHERE rowid = "
+                    "(SELECT rowid FROM recipes WHERE recipe_id = ?)",
+                    ids,
+                )
+                self._connection.executemany(
+                    "INSERT INTO recipe_search (rowid, name, description, steps) "
+                    "SELECT rowid, ?, ?, ? FROM recipes WHERE recipe_id = ?",
+                    [
+                        (
+                            recipe.name,
+                            recipe.description,
+                            " ".join(step.description for step in recipe.steps),
+                            recipe.recipe_id,
+                        )
+                        for recipe in recipes
+                    ],
+                )
+            self._connection.executemany(
+                "DELETE FROM recipe_ingredients WHERE recipe_id = ?", ids
+            )
+            self._connection.executemany(
+                "DELETE FROM recipe_steps WHERE recipe_id = ?", ids
+            )
+            self._connection.executemany(
+                "INSERT INTO recipe_ingredients VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        recipe.recipe_id,
+                        position,
+                        ingredient.name,
+                        ingredient.quantity,
+                        format_unit(ingredient.unit),
+                        canonical_name(ingredient.name),
+                    )
+                    for recipe in recipes
+                    for position, ingredient in enumerate(recipe.ingredients)
+                ],
+            )
+            self._connection.executemany(
+                "INSERT INTO recipe_steps VALUES (?, ?, ?)",
+                [
+                    (recipe.recipe_id, position, step.description)
+                    for recipe in recipes
+                    for position, step in enumerate(recipe.steps)
+                ],
+            )
+
+    def get_recipe(self, recipe_id: str) -> Optional[Recipe]:
+        """
+        Loads a recipe by id.
+
+        Args:
+            recipe_id: The id of the recipe.
+
+        Returns:
+            Optional[Recipe]: The recipe, or None if it is not stored.
+        """
+        recipes = list(self._load_recipes("WHERE recipe_id = ?", (recipe_id,)))
+        return recipes[0] if recipes else None
+
+    def iter_recipes(self) -> Iterator[Recipe]:
+        """
+        Streams every stored recipe, ordered by recipe_id.
+
+        Yields:
+            Recipe: Each stored recipe.
+        """
+        return self._load_recipes("", ())
+
+    def _load_recipes(self, where: str, parameters: tuple) -> Iterator[Recipe]:
+        """Loads recipes matching ``where`` with their children via ordered merge joins."""
+        cursor = self._connection.cursor
+        recipe_rows = cursor().execute(
+            f"SELECT {_RECIPE_COLUMNS} FROM recipes {where} ORDER BY recipe_id",
+            parameters,
+        )
+        ingredient_groups = groupby(
+            cursor().execute(
+                "SELECT recipe_id, name, quantity, unit FROM recipe_ingredients "
+                f"{where} ORDER BY recipe_id, position",
+                parameters,
+            ),
+            key=itemgetter(0),
+        )
+        step_groups = groupby(
+            cursor().execute(
+                f"SELECT recipe_id, description FROM recipe_steps {where} "
+                "ORDER BY recipe_id, position",
+                parameters,
+            ),
+            key=itemgetter(0),
+        )
+        ingredients = _GroupCursor(ingredient_groups)
+        steps = _GroupCursor(step_groups)
+        for row in recipe_rows:
+            data = dict(row)
+            data["ingredients"] = [
+                {"name": name, "quantity": quantity, "unit": unit}
+                for _, name, quantity, unit in ingredients.take(row["recipe_id"])
+            ]
+            data["steps"] = [
+                {"description": description}
+                for _, description in steps.take(row["recipe_id"])
+            ]
+            yield Recipe.load_without_image_checks(data)
+
+    def delete_recipe(self, recipe_id: str) -> bool:
+        """
+        Deletes a recipe with its ingredients and steps.
+
+        Args:
+            recipe_id: The id of the recipe.
+
+        Returns:
+            bool: True if a recipe was deleted.
+        """
+        with self._connection:
+            if self._full_text:
+                self._connection.execute(
+                    "DELETE FROM recipe_search WHERE rowid = "
+                    "(SELECT rowid FROM recipes WHERE recipe_id = ?)",
+                    (recipe_id,),
+                )
+            cursor = self._connection.execute(
+                "DELETE FROM recipes WHERE recipe_id = ?", (recipe_id,)
+            )
+        return cursor.rowcount > 0
+
+    def search_recipes(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Full-text searches recipe names, descriptions and steps with FTS5.
+
+        Takes the query syntax of ``search.RecipeSearchIndex``: recipes match
+        if they contain any word of the query, and words prefixed with "-",
+        "no" or "without" exclude recipes. Results are ranked with FTS5's
+        BM25, with name matches weighted ``NAME_WEIGHT`` times.
+
+        Args:
+            query: The query, e.g. "braise" or "quick pasta no oven".
+            limit: The maximum number of results.
+
+        Returns:
+            List[Tuple[str, float]]: (recipe_id, score) pairs, best first.
+            A query with only exclusions returns every other recipe with a
+            score of 0, ordered by recipe_id.
+
+        Raises:
+            ValueError: If limit is not positive.
+            RuntimeError: If SQLite was built without FTS5.
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be greater than 0. Got: {limit}")
+        if not self._full_text:
+            raise RuntimeError("Full-text search needs SQLite built with FTS5.")
+        included, excluded = parse_query(query)
+        exclusion = ""
+        parameters: list = []
+        if excluded:
+            exclusion = (
+                "recipes.rowid NOT IN (SELECT rowid FROM recipe_search "
+                "WHERE recipe_search MATCH ?)"
+            )
+            parameters.append(_match_expression(excluded))
+        if not included:
+            where = f"WHERE {exclusion}" if exclusion else ""
+            rows = self._connection.execute(
+                f"SELECT recipe_id, 0.0 FROM recipes {where} "
+                "ORDER BY recipe_id LIMIT ?",
+                (*parameters, limit),
+            )
+        else:
+            rows = self._connection.execute(
+                "SELECT recipes.recipe_id, "
+                "-bm25(recipe_search, ?, 1.0, 1.0) AS score "
+                "FROM recipe_search JOIN recipes "
+                "ON recipes.rowid = recipe_search.rowid "
+                "WHERE recipe_search MATCH ? "
+                f"{'AND ' + exclusion if exclusion else ''} "
+                "ORDER BY score DESC, recipes.recipe_id LIMIT ?",
+                (float(NAME_WEIGHT), _match_expression(included), *parameters, limit),
+            )
+        return [(recipe_id, score) for recipe_id, score in rows]
+
+    def count_recipes(self) -> int:
+        """Returns the number of stored recipes."""
+        return self._connection.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
+
+    def recipe_ids_with_ingredient(self, name: str) -> List[str]:
+        """
+        Returns the ids of recipes using an ingredient, via the canonical name index.
+
+        Args:
+            name: The ingredient name, in any spelling.
+
+        Returns:
+            List[str]: The matching recipe ids, sorted.
+        """
+        rows = self._connection.execute(
+            "SELECT DISTINCT recipe_id FROM recipe_ingredients WHERE name_key = ? "
+            "ORDER BY recipe_id",
+            (canonical_name(name),),
+        )
+        return [row[0] for row in rows]
+
+    # Inventory
+
+    def add_inventory_items(
+        self, items: Iterable[InventoryItem], batch_size: int = 1000
+    ) -> int:
+        """
+        Inserts or replaces inventory items, one transaction per batch.
+
+        Args:
+            items: The items to store; each must have an ``inventory_id``.
+            batch_size: Number of items written per transaction.
+
+        Returns:
+            int: The number of items written.
+
+        Raises:
+            ValueError: If an item has no inventory_id or batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be greater than 0. Got: {batch_size}")
+        iterator = iter(items)
+        count = 0
+        while batch := list(islice(iterator, batch_size)):
+            for item in batch:
+                if item.inventory_id is None:
+                    raise ValueError(
+                        f"Inventory item '{item.name}' has no inventory_id to store."
+                    )
+            with self._connection:
+                self._connection.executemany(
+                    f"INSERT OR REPLACE INTO inventory ({_INVENTORY_COLUMNS}, "
+                    "name_key) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            item.inventory_id,
+                            item.name,
+                            item.quantity,
+                            format_unit(item.unit),
+                            item.storage_location,
+                            canonical_name(item.name),
+                        )
+                        for item in batch
+                    ],
+                )
+            count += len(batch)
+        return count
+
+    def get_inventory_item(self, inventory_id: str) -> Optional[InventoryItem]:
+        """
+        Loads an inventory item by id.
+
+        Args:
+            inventory_id: The id of the item.
+
+        Returns:
+            Optional[InventoryItem]: The item, or None if it is not stored.
+        """
+        row = self._connection.execute(
+            f"SELECT {_INVENTORY_COLUMNS} FROM inventory WHERE inventory_id = ?",
+            (inventory_id,),
+        ).fetchone()
+        return InventoryItem.model_validate(dict(row)) if row else None
+
+    def iter_inventory(self) -> Iterator[InventoryItem]:
+        """
+        Streams every stored inventory item, ordered by inventory_id.
+
+        Yields:
+            InventoryItem: Each stored item.
+        """
+        rows = self._connection.execute(
+            f"SELECT {_INVENTORY_COLUMNS} FROM inventory ORDER BY inventory_id"
+        )
+        for row in rows:
+            yield InventoryItem.model_validate(dict(row))
+
+    def inventory_items_with_name(self, name: str) -> List[InventoryItem]:
+        """
+        Returns the inventory items of an ingredient, via the canonical name index.
+
+        Args:
+            name: The ingredient name, in any spelling.
+
+        Returns:
+            List[InventoryItem]: The matching items, ordered by inventory_id.
+        """
+        rows = self._connection.execute(
+            f"SELECT {_INVENTORY_COLUMNS} FROM inventory WHERE name_key = ? "
+            "ORDER BY inventory_id",
+            (canonical_name(name),),
+        )
+        return [InventoryItem.model_validate(dict(row)) for row in rows]
+
+    def delete_inventory_item(self, inventory_id: str) -> bool:
+        """
+        Deletes an inventory item.
+
+        Args:
+            inventory_id: The id of the item.
+
+        Returns:
+            bool: True if an item was deleted.
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM inventory WHERE inventory_id = ?", (inventory_id,)
+            )
+        return cursor.rowcount > 0
+
+
+def _match_expression(terms: List[str]) -> str:
+    """Builds an FTS5 query matching any of the terms, each quoted as a string."""
+    return " OR ".join(f'"{term}"' for term in dict.fromkeys(terms))
+
+
+class _GroupCursor:
+    """Walks ``groupby`` groups keyed by recipe_id in step with an ordered recipe scan."""
+
+    def __init__(self, groups: Iterator):
+        self._groups = groups
+        self._current: Optional[tuple] = next(groups, None)
+
+    def take(self, key: str) -> List[tuple]:
+        """Returns the rows for ``key``, skipping any groups ordered before it."""
+        while self._current is not None and self._current[0] < key:
+            self._current = next(self._groups, None)
+        if self._current is None or self._current[0] != key:
+            return []
+        rows = list(self._current[1])
+        self._current = next(self._groups, None)
+        return rows
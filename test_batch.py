@@ -0,0 +1,92 @@
+"""
+Test suite for the columnar IngredientBatch in batch.py.
+"""
+
+import pytest
+from pint import DimensionalityError
+
+from batch import IngredientBatch, scale_recipes
+from model import Ingredient, Recipe, Step, ureg
+
+
+@pytest.fixture
+def ingredients():
+    return [
+        Ingredient(name="Flour", quantity=500.0, unit=ureg.gram),
+        Ingredient(name="Sugar", quantity=0.25, unit=ureg.kilogram),
+        Ingredient(name="Flour", quantity=1.0, unit=ureg.kilogram),
+        Ingredient(name="Eggs", quantity=3.0, unit=ureg.dimensionless),
+    ]
+
+
+def test_round_trip_is_lossless(ingredients):
+    """Test that packing and unpacking ingredients preserves every row."""
+    batch = IngredientBatch.from_ingredients(ingredients)
+    assert len(batch) == len(ingredients)
+    assert batch.to_ingredients() == ingredients
+
+
+def test_names_and_units_are_coded_once(ingredients):
+    """Test that repeated names and units share a single table entry."""
+    batch = IngredientBatch.from_ingredients(ingredients)
+    assert batch.names == ["Flour", "Sugar", "Eggs"]
+    assert list(batch.name_codes) == [0, 1, 0, 2]
+    assert len(batch.units) == 3
+
+
+@pytest.mark.parametrize("factor", [0.5, 2.0, 3.0])
+def test_scale_multiplies_quantities(ingredients, factor):
+    """Test that scaling leaves the original batch untouched."""
+    batch = IngredientBatch.from_ingredients(ingredients)
+    scaled = batch.scale(factor)
+    assert list(scaled.quantities) == [i.quantity * factor for i in ingredients]
+    assert list(batch.quantities) == [i.quantity for i in ingredients]
+
+
+@pytest.mark.parametrize("factor", [0.0, -1.0, float("nan")])
+def test_scale_rejects_non_positive_factor(ingredients, factor):
+    """Test that non-positive and NaN scaling factors raise ValueError."""
+    with pytest.raises(ValueError):
+        IngredientBatch.from_ingredients(ingredients).scale(factor)
+
+
+def test_quantities_in_and_sum_by_name(ingredients):
+    """Test converting and summing compatible rows in a target unit."""
+    batch = IngredientBatch.from_ingredients(ingredients[:3])
+    assert list(batch.quantities_in(ureg.gram)) == pytest.approx([500, 250, 1000])
+    assert batch.sum_by_name(ureg.gram) == pytest.approx(
+        {"Flour": 1500.0, "Sugar": 250.0}
+    )
+
+
+def test_quantities_in_rejects_incompatible_units(ingredients):
+    """Test that converting mixed dimensions raises DimensionalityError."""
+    with pytest.raises(DimensionalityError):
+        IngredientBatch.from_ingredients(ingredients).quantities_in(ureg.gram)
+
+
+def test_scale_recipes_with_per_recipe_factors():
+    """Test scaling several recipes in one pass with individual factors."""
+    recipes = [
+        Recipe(
+            name=f"Recipe {i}",
+            ingredients=[Ingredient(name="Rice", quantity=100.0, unit=ureg.gram)],
+            steps=[Step(description="Cook.")],
+        )
+        for i in range(3)
+    ]
+    scaled = scale_recipes(recipes, [1.0, 10.0, 20.0], normalize=True)
+    assert [r.name for r in scaled] == [r.name for r in recipes]
+    assert [(i.quantity, i.unit) for r in scaled for i in r.ingredients] == [
+        (100.0, ureg.gram),
+        (pytest.approx(1.0), ureg.kilogram),
+        (pytest.approx(2.0), ureg.kilogram),
+    ]
+
+
+@pytest.mark.parametrize("factors", [[1.0], [1.0, 0.0], [1.0, float("nan")]])
+def test_scale_recipes_rejects_bad_factors(factors):
+    """Test that a wrong factor count or non-positive factor raises ValueError."""
+    recipe = Recipe(name="Toast", ingredients=[], steps=[])
+    with pytest.raises(ValueError):
+        scale_recipes([recipe, recipe], factors)
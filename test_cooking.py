@@ -0,0 +1,224 @@
+"""
+Test suite for the "what can I cook now" engine in cooking.py.
+"""
+
+import pytest
+
+from cooking import (
+    FeasibilityEngine,
+    IngredientBitsets,
+    iter_bits,
+    recipe_requirements,
+    shortfall,
+)
+from inventory import Inventory
+from model import InventoryItem, ureg
+
+
+def stock(*items):
+    return Inventory(
+        InventoryItem(inventory_id=str(i), name=name, quantity=quantity, unit=unit)
+        for i, (name, quantity, unit) in enumerate(items)
+    )
+
+
+@pytest.fixture
+def engine(make_recipe):
+    return FeasibilityEngine(
+        [
+            make_recipe(
+                "pancakes", ("Flour", 200.0, ureg.gram), ("Milk", 1.0, ureg.cup)
+            ),
+            make_recipe("omelette", ("Eggs", 3.0, ureg.dimensionless)),
+            make_recipe(
+                "bread", ("flour", 0.5, ureg.kilogram), ("Yeast", 7.0, ureg.gram)
+            ),
+            make_recipe("water"),
+        ]
+    )
+
+
+def test_requirements_are_summed_in_canonical_units(make_recipe):
+    """Test that repeated ingredients are summed after unit conversion."""
+    requirements = recipe_requirements(
+        make_recipe(
+            "dough", ("Flour", 0.5, ureg.kilogram), ("flour ", 100.0, ureg.gram)
+        )
+    )
+    assert requirements == {"flour": {ureg.gram: pytest.approx(600.0)}}
+
+
+@pytest.mark.parametrize(
+    "items,expected",
+    [
+        ((), ["water"]),
+        (
+            (("flour", 1.0, ureg.kilogram), ("milk", 250.0, ureg.milliliter)),
+            ["pancakes", "water"],
+        ),
+        (
+            (("flour", 100.0, ureg.gram), ("milk", 1.0, ureg.liter)),
+            ["water"],
+        ),
+        (
+            (
+                ("Flour", 0.25, ureg.kilogram),
+                ("Flour", 300.0, ureg.gram),
+                ("Yeast", 1.0, ureg.ounce),
+                ("Eggs", 3.0, ureg.dimensionless),
+            ),
+            ["omelette", "bread", "water"],
+        ),
+    ],
+)
+def test_cookable(engine, items, expected):
+    """Test that only recipes with every ingredient in sufficient quantity match."""
+    assert [r.recipe_id for r in engine.cookable(stock(*items))] == expected
+
+
+def test_incompatible_units_do_not_count(make_recipe):
+    """Test that stock in another dimensionality does not satisfy a requirement."""
+    engine = FeasibilityEngine([make_recipe("tea", ("Saffron", 1.0, ureg.teaspoon))])
+    assert engine.cookable(stock(("Saffron", 500.0, ureg.gram))) == []
+
+
+@pytest.mark.parametrize(
+    "items,cookable",
+    [
+        ((("Flour", 300.0, ureg.gram), ("Eggs", 120.0, ureg.gram)), True),
+        ((("Flour", 200.0, ureg.gram), ("Eggs", 2.0, ureg.dimensionless)), False),
+        ((("Flour", 3.0, ureg.cup), ("Egg", 1.0, ureg.dimensionless)), False),
+    ],
+)
+def test_densities_bridge_units(items, cookable, make_recipe):
+    """Test that mass, volume and counts are compared through densities."""
+    engine = FeasibilityEngine(
+        [
+            make_recipe(
+                "cake",
+                ("Flour", 2.0, ureg.cup),
+                ("Eggs", 2.0, ureg.dimensionless),
+            )
+        ]
+    )
+    assert bool(engine.cookable(stock(*items))) is cookable
+
+
+def test_recipes_using(engine):
+    """Test the inverted index lookup by normalized ingredient name."""
+    assert [r.recipe_id for r in engine.recipes_using(" FLOUR")] == [
+        "pancakes",
+        "bread",
+    ]
+    assert engine.recipes_using("saffron") == []
+    assert len(engine) == 4
+
+
+@pytest.mark.parametrize(
+    "bitset,expected", [(0, []), (1, [0]), (0b101100, [2, 3, 5]), (1 << 200, [200])]
+)
+def test_iter_bits(bitset, expected):
+    """Test that set bit positions are yielded in increasing order."""
+    assert list(iter_bits(bitset)) == expected
+
+
+def test_bitsets_subset_matching():
+    """Test that recipes match when their names are a subset of the stock mask."""
+    bitsets = IngredientBitsets()
+    bitsets.add(["flour", "milk"])
+    bitsets.add(["eggs"])
+    bitsets.add([])
+    bitsets.add(["flour"])
+
+    assert bitsets.recipe_masks == [0b11, 0b100, 0, 0b1]
+    assert list(iter_bits(bitsets.recipes_with("flour"))) == [0, 3]
+    assert bitsets.mask(["milk", "saffron"]) == 0b10
+    assert list(iter_bits(bitsets.subsets_of(bitsets.mask(["flour"])))) == [2, 3]
+    assert list(iter_bits(bitsets.subsets_of(bitsets.mask(["flour", "milk"])))) == [
+        0,
+        2,
+        3,
+    ]
+
+
+def test_shortfall_counts_missing_and_short_requirements():
+    """Test that absent and insufficient ingredients both count as shortfall."""
+    requirements = {
+        "flour": {ureg.gram: 200.0},
+        "milk": {ureg.milliliter: 100.0},
+        "eggs": {ureg.dimensionless: 2.0},
+    }
+    stock = {"flour": {ureg.gram: 50.0}, "eggs": {ureg.dimensionless: 6.0}}
+    count, score = shortfall(requirements, stock)
+    assert count == 2
+    assert score == pytest.approx(0.75 + 1.0)
+
+
+def test_closest_ranks_by_shortfall(engine):
+    """Test that recipes are ranked by missing count, then missing fraction."""
+    inventory = stock(("Flour", 150.0, ureg.gram), ("Eggs", 3.0, ureg.dimensionless))
+    ranked = engine.closest(inventory, k=4)
+
+    assert [s.recipe.recipe_id for s in ranked] == [
+        "omelette",
+        "water",
+        "pancakes",
+        "bread",
+    ]
+    assert [s.missing_count for s in ranked] == [0, 0, 2, 2]
+    assert ranked[0].score == 0.0
+    assert ranked[2].score == pytest.approx(0.25 + 1.0)
+    assert [s.recipe.recipe_id for s in engine.closest(inventory, k=1)] == ["omelette"]
+    assert {(i.name, round(i.quantity, 6), i.unit) for i in ranked[3].missing} == {
+        ("flour", 350.0, ureg.gram),
+        ("yeast", 7.0, ureg.gram),
+    }
+
+
+@pytest.mark.parametrize(
+    "max_missing,expected",
+    [(0, ["omelette", "water"]), (1, ["omelette", "water", "pancakes"])],
+)
+def test_closest_respects_max_missing(engine, max_missing, expected):
+    """Test that recipes missing more than max_missing ingredients are excluded."""
+    inventory = stock(("Milk", 1.0, ureg.liter), ("Eggs", 3.0, ureg.dimensionless))
+    ranked = engine.closest(inventory, k=10, max_missing=max_missing)
+    assert [s.recipe.recipe_id for s in ranked] == expected
+
+
+def test_closest_uses_readable_units(engine, make_recipe):
+    """Test that missing amounts are expressed in normalized units."""
+    ranked = engine.closest(stock(("Flour", 100.0, ureg.gram)), k=10)
+    bread = next(s for s in ranked if s.recipe.recipe_id == "bread")
+    flour = next(i for i in bread.missing if i.name == "flour")
+    assert (flour.quantity, flour.unit) == (pytest.approx(400.0), ureg.gram)
+
+    engine = FeasibilityEngine([make_recipe("feast", ("Flour", 2500.0, ureg.gram))])
+    (flour,) = engine.closest(stock(("Flour", 1.0, ureg.kilogram)))[0].missing
+    assert (flour.quantity, flour.unit) == (pytest.approx(1.5), ureg.kilogram)
+
+
+@pytest.mark.parametrize("k,max_missing", [(0, None), (5, -1)])
+def test_closest_rejects_bad_arguments(engine, k, max_missing):
+    """Test that a non-positive k or negative max_missing raises ValueError."""
+    with pytest.raises(ValueError):
+        engine.closest(stock(), k=k, max_missing=max_missing)
+
+
+def test_recipes_using_fuzzy(make_recipe):
+    """Test that fuzzy lookups match similar ingredient names."""
+    engine = FeasibilityEngine(
+        [
+            make_recipe("risotto", ("Parmesan Cheese", 50.0, ureg.gram)),
+            make_recipe(
+                "pesto", ("Basil", 30.0, ureg.gram), ("parmesan", 20.0, ureg.gram)
+            ),
+            make_recipe("salad", ("Tomatoes", 2.0, ureg.dimensionless)),
+        ]
+    )
+    assert [r.recipe_id for r in engine.recipes_using("parmesan")] == ["pesto"]
+    assert [r.recipe_id for r in engine.recipes_using("parmesan", fuzzy=True)] == [
+        "risotto",
+        "pesto",
+    ]
+    assert engine.recipes_using("xylophone", fuzzy=True) == []
@@ -0,0 +1,63 @@
+"""
+Test suite for the ingredient density and piece weight tables in density.py.
+"""
+
+import pytest
+from pint import DimensionalityError
+
+from density import convert_ingredient, ingredient_unit
+from model import ureg
+
+
+@pytest.mark.parametrize(
+    "name,unit,expected_unit,expected_factor",
+    [
+        ("flour", ureg.cup, ureg.gram, 236.5882365 * 0.53),
+        ("flour", ureg.kilogram, ureg.gram, 1000.0),
+        ("milk", ureg.gram, ureg.milliliter, 1 / 1.03),
+        ("milk", ureg.liter, ureg.milliliter, 1000.0),
+        ("egg", ureg.gram, ureg.dimensionless, 1 / 50.0),
+        ("egg", ureg.dimensionless, ureg.dimensionless, 1.0),
+        ("saffron", ureg.teaspoon, ureg.milliliter, 4.92892159375),
+        ("saffron", ureg.ounce, ureg.gram, 28.349523125),
+    ],
+)
+def test_ingredient_unit(name, unit, expected_unit, expected_factor):
+    """Test the aggregation unit and factor chosen for each ingredient."""
+    aggregation_unit, factor = ingredient_unit(name, unit)
+    assert aggregation_unit == expected_unit
+    assert factor == pytest.approx(expected_factor)
+
+
+def test_lookups_are_cached():
+    """Test that repeated (name, unit) lookups hit the cache."""
+    ingredient_unit("sugar", ureg.cup)
+    hits = ingredient_unit.cache_info().hits
+    ingredient_unit("sugar", ureg.cup)
+    assert ingredient_unit.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize(
+    "name,magnitude,source,target,expected",
+    [
+        ("flour", 1.0, ureg.cup, ureg.gram, 236.5882365 * 0.53),
+        ("butter", 96.0, ureg.gram, ureg.milliliter, 100.0),
+        ("egg", 3.0, ureg.dimensionless, ureg.ounce, 150.0 / 28.349523125),
+        ("saffron", 2.0, ureg.gram, ureg.milligram, 2000.0),
+    ],
+)
+def test_convert_ingredient(name, magnitude, source, target, expected):
+    """Test conversions across mass, volume and counts."""
+    assert convert_ingredient(name, magnitude, source, target) == pytest.approx(
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    "name,source,target",
+    [("saffron", ureg.gram, ureg.milliliter), ("flour", ureg.dimensionless, ureg.gram)],
+)
+def test_convert_ingredient_without_table_entry(name, source, target):
+    """Test that conversions the tables cannot bridge raise DimensionalityError."""
+    with pytest.raises(DimensionalityError):
+        convert_ingredient(name, 1.0, source, target)
@@ -0,0 +1,62 @@
+"""
+Test suite for the trigram fuzzy name index in fuzzy.py.
+"""
+
+import pytest
+
+from fuzzy import TrigramIndex, trigrams
+
+
+def test_trigrams_pad_each_word():
+    """Test that each word is padded and word order does not matter."""
+    assert trigrams("egg") == {"  e", " eg", "egg", "gg "}
+    assert trigrams("olive oil") == trigrams("oil olive")
+    assert trigrams("") == frozenset()
+
+
+@pytest.fixture
+def index():
+    return TrigramIndex(
+        ["Parmesan Cheese", "Cheddar Cheese", "Tomatoes", "Tomato Paste", "Basil"]
+    )
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("parmesan", "parmesan cheese"),
+        ("tomatos", "tomato"),
+        ("BASIL", "basil"),
+        ("chedar", "cheddar cheese"),
+    ],
+)
+def test_search_finds_best_match(index, query, expected):
+    """Test that partial and misspelled names find the intended name first."""
+    assert index.search(query)[0][0] == expected
+
+
+def test_search_orders_and_limits_matches(index):
+    """Test that matches are sorted by similarity and cut at the limit."""
+    matches = index.search("tomato", limit=2)
+    assert [name for name, _ in matches] == ["tomato", "tomato paste"]
+    assert matches[0][1] == 1.0 > matches[1][1]
+    assert index.search("xylophone") == []
+    assert index.search("cheese", threshold=0.9) == []
+
+
+def test_add_and_discard(index):
+    """Test that spelling variants share one entry and can be removed."""
+    assert len(index) == 5
+    assert index.add("tomato") == "tomato"
+    assert len(index) == 5
+    index.discard("TOMATOES")
+    index.discard("not indexed")
+    assert "tomato" not in index
+    assert [name for name, _ in index.search("tomato")] == ["tomato paste"]
+
+
+@pytest.mark.parametrize("limit,threshold", [(0, 0.3), (5, -0.1), (5, 1.5)])
+def test_search_rejects_bad_arguments(index, limit, threshold):
+    """Test that invalid limits and thresholds raise ValueError."""
+    with pytest.raises(ValueError):
+        index.search("basil", limit=limit, threshold=threshold)
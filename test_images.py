@@ -0,0 +1,144 @@
+"""
+Test suite for the image path checks in images.py.
+"""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from images import BackgroundImageVerifier, StatCache, verify_recipe_images
+from model import Recipe
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_stat_cache_hits_filesystem_once_per_ttl(tmp_path):
+    """Test that repeated checks within the TTL reuse the cached answer."""
+    clock = FakeClock()
+    cache = StatCache(ttl_seconds=10.0, clock=clock)
+    path = tmp_path / "dish.png"
+    path.touch()
+
+    assert cache.is_file(path)
+    path.unlink()
+    clock.now = 9.0
+    assert cache.is_file(path)  # Still cached
+    clock.now = 10.0
+    assert not cache.is_file(path)  # Expired, re-checked
+
+
+def test_stat_cache_invalidate(tmp_path):
+    """Test that invalidating a path forces a fresh filesystem check."""
+    cache = StatCache(ttl_seconds=60.0)
+    path = tmp_path / "dish.png"
+    assert not cache.is_file(path)
+    path.touch()
+    assert not cache.is_file(path)
+    cache.invalidate(path)
+    assert cache.is_file(path)
+
+
+def test_stat_cache_evicts_least_recently_used(tmp_path):
+    """Test that the cache keeps at most max_entries paths."""
+    cache = StatCache(max_entries=2)
+    first, second, third = (tmp_path / f"{i}.png" for i in range(3))
+    first.touch()
+    cache.is_file(first)
+    cache.is_file(second)
+    cache.is_file(first)  # Refreshes first, so second is evicted next
+    cache.is_file(third)
+    assert len(cache) == 2
+    first.unlink()
+    assert cache.is_file(first)  # Still cached
+
+
+@pytest.mark.parametrize("kwargs", [{"ttl_seconds": -1.0}, {"max_entries": 0}])
+def test_stat_cache_rejects_bad_arguments(kwargs):
+    """Test that a negative TTL or a non-positive size raises ValueError."""
+    with pytest.raises(ValueError):
+        StatCache(**kwargs)
+
+
+def test_validation_can_defer_image_checks(tmp_path):
+    """Test that recipes validate immediately and missing images are reported later."""
+    present = tmp_path / "present.png"
+    present.touch()
+    records = [
+        {"name": "A", "ingredients": [], "steps": [], "image_path": present},
+        {
+            "name": "B",
+            "ingredients": [],
+            "steps": [],
+            "image_path": tmp_path / "gone.png",
+        },
+    ]
+
+    with BackgroundImageVerifier(stat_cache=StatCache()) as verifier:
+        recipes = [
+            Recipe.model_validate(r, context={"image_verifier": verifier})
+            for r in records
+        ]
+        assert len(recipes) == 2
+        assert verifier.missing() == [tmp_path / "gone.png"]
+
+    with pytest.raises(ValidationError):
+        Recipe.model_validate(records[1])
+
+
+def test_verify_recipe_images_reports_problems(tmp_path):
+    """Test that format-only validation plus async verification finds bad images."""
+    (tmp_path / "present.png").touch()
+    context = {"check_image_exists": False}
+    recipes = [
+        Recipe.model_validate(
+            {"recipe_id": rid, "name": rid, "ingredients": [], "steps": [], **extra},
+            context=context,
+        )
+        for rid, extra in [
+            ("present", {"image_path": tmp_path / "present.png"}),
+            ("gone", {"image_path": tmp_path / "gone.webp"}),
+            ("none", {}),
+        ]
+    ]
+    recipes.append(
+        Recipe.load_without_image_checks(
+            {
+                "recipe_id": "gif",
+                "name": "gif",
+                "ingredients": [],
+                "steps": [],
+                "image_path": tmp_path / "anim.gif",
+            }
+        )
+    )
+
+    problems = asyncio.run(
+        verify_recipe_images(recipes, max_concurrency=2, stat_cache=StatCache())
+    )
+
+    assert [(p.recipe_id, p.problem) for p in problems] == [
+        ("gone", "missing"),
+        ("gif", "wrong_format"),
+    ]
+
+
+def test_format_only_validation_still_rejects_wrong_format():
+    """Test that skipping existence checks keeps the format check."""
+    with pytest.raises(ValidationError):
+        Recipe.model_validate(
+            {"name": "A", "ingredients": [], "steps": [], "image_path": "a.gif"},
+            context={"check_image_exists": False},
+        )
+
+
+def test_verify_recipe_images_rejects_bad_concurrency():
+    """Test that a non-positive concurrency limit raises ValueError."""
+    with pytest.raises(ValueError):
+        asyncio.run(verify_recipe_images([], max_concurrency=0))
@@ -10,6 +10,7 @@ from pydantic import ValidationError
 from pint import Quantity
 
 from model import Ingredient, ureg
+from units import parse_unit
 
 
 @pytest.mark.parametrize(
@@ -92,9 +93,9 @@ def test_create_ingredient_invalid_quantity(quantity, expected_error):
 @pytest.mark.parametrize(
     "unit",
     [
-        "gram",  # String instead of Unit
-        "ml",  # String representation
         "bananas",  # Invalid unit
+        "",  # Empty string
+        "2 g",  # Scaling factor
         123,  # Integer
         None,  # None value
         [],  # List
@@ -107,6 +108,43 @@ def test_create_ingredient_invalid_unit_type(unit):
         Ingredient(name="Test", quantity=1.0, unit=unit)
 
 
+@pytest.mark.parametrize(
+    "unit,expected",
+    [
+        ("gram", ureg.gram),
+        ("ml", ureg.milliliter),
+        ("tbsp", ureg.tablespoon),
+        ("tsp", ureg.teaspoon),
+        ("g", ureg.gram),
+        ("Cups", ureg.cup),
+        ("pinches", ureg.pinch),
+        ("pieces", ureg.dimensionless),
+        ("Tbsp", ureg.tablespoon),
+        ("Pinch", ureg.pinch),
+        ("c", ureg.cup),
+        ("Ml", ureg.milliliter),
+        ("ML", ureg.milliliter),
+        ("MG", ureg.milligram),
+        ("t", ureg.teaspoon),
+        ("T", ureg.tablespoon),
+    ],
+)
+def test_create_ingredient_unit_string(unit, expected):
+    """Test that unit strings and kitchen aliases are parsed into Pint units."""
+    ingredient = Ingredient(name="Test", quantity=1.0, unit=unit)
+    assert ingredient.unit == expected
+
+
+def test_unit_string_parsing_is_cached():
+    """Test that repeated unit strings are served from the parse cache."""
+    parse_unit.cache_clear()
+    for _ in range(3):
+        Ingredient(name="Test", quantity=1.0, unit="kg")
+    info = parse_unit.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
 @pytest.mark.parametrize(
     "missing_field",
     [
@@ -190,3 +228,54 @@ def test_to_quantity_returns_quantity_object(name, quantity, unit):
     assert isinstance(result, Quantity)
     assert result.magnitude == quantity
     assert result.units == unit
+
+
+@pytest.mark.parametrize(
+    "quantity,unit,target,expected",
+    [
+        (2.0, ureg.kilogram, ureg.gram, 2000.0),
+        (1.0, ureg.cup, ureg.milliliter, 236.5882365),
+        (6.0, ureg.teaspoon, ureg.tablespoon, 2.0),
+    ],
+)
+def test_ingredient_to_converts_units(quantity, unit, target, expected):
+    """Test that to() and quantity_in() convert to a compatible unit."""
+    ingredient = Ingredient(name="Test", quantity=quantity, unit=unit)
+    assert ingredient.quantity_in(target) == pytest.approx(expected)
+    result = ingredient.to(target)
+    assert isinstance(result, Quantity)
+    assert result.units == target
+    assert result.magnitude == pytest.approx(expected)
+    assert result.magnitude == pytest.approx(ingredient.to_quantity().to(target).m)
+
+
+@pytest.mark.parametrize(
+    "unit,expected_json",
+    [
+        (ureg.gram, "g"),
+        (ureg.cup, "cp"),
+        (ureg.tablespoon, "tbsp"),
+        (ureg.pinch, "pinch"),
+        (ureg.dimensionless, "dimensionless"),
+        (ureg.gram / ureg.milliliter, "g / ml"),
+        (ureg.coulomb, "coulomb"),
+        (ureg.gauss, "gauss"),
+        (ureg.megaliter, "megaliter"),
+        (ureg.parsec, "pc"),
+        (ureg.degree_Celsius, "°C"),
+        (ureg.speed_of_light, "speed_of_light"),
+    ],
+)
+def test_ingredient_json_round_trip(unit, expected_json):
+    """Test that units serialize to short strings and parse back from JSON."""
+    ingredient = Ingredient(name="Test", quantity=2.0, unit=unit)
+    assert ingredient.model_dump(mode="json")["unit"] == expected_json
+    restored = Ingredient.model_validate_json(ingredient.model_dump_json())
+    assert restored == ingredient
+
+
+@pytest.mark.parametrize("payload", ['{"name": "Test", "quantity": 1, "unit": 5}'])
+def test_ingredient_json_rejects_non_string_unit(payload):
+    """Test that JSON input requires the unit as a string."""
+    with pytest.raises(ValidationError):
+        Ingredient.model_validate_json(payload)
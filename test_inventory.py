@@ -0,0 +1,95 @@
+"""
+Test suite for the indexed Inventory container in inventory.py.
+"""
+
+import pytest
+
+from inventory import Inventory
+from model import InventoryItem, ureg
+
+
+def item(inventory_id, name, quantity, unit, location=None):
+    return InventoryItem(
+        inventory_id=inventory_id,
+        name=name,
+        quantity=quantity,
+        unit=unit,
+        storage_location=location,
+    )
+
+
+@pytest.fixture
+def inventory():
+    return Inventory(
+        [
+            item("1", "Olive Oil", 500.0, ureg.milliliter, "Pantry"),
+            item("2", "olive  oil", 1.0, ureg.liter, "pantry"),
+            item("3", "Milk", 2.0, ureg.cup, "Fridge"),
+            item("4", "Eggs", 6.0, ureg.dimensionless, "Fridge"),
+        ]
+    )
+
+
+def test_lookups_by_id_name_and_location(inventory):
+    """Test the id, name and storage location indexes."""
+    assert inventory.get("3").name == "Milk"
+    assert inventory.get("missing") is None
+    assert [i.inventory_id for i in inventory.find("OLIVE OIL")] == ["1", "2"]
+    assert [i.inventory_id for i in inventory.in_location("fridge")] == ["3", "4"]
+    assert "milk" in inventory
+    assert "butter" not in inventory
+    assert len(inventory) == 4
+
+
+@pytest.mark.parametrize(
+    "name,unit,expected",
+    [
+        ("Olive Oil", ureg.milliliter, 1500.0),
+        ("Olive Oil", ureg.liter, 1.5),
+        ("Milk", ureg.milliliter, 2 * 236.5882365),
+        ("Eggs", ureg.dimensionless, 6.0),
+        ("Eggs", ureg.gram, 300.0),  # Through the piece weight
+        ("Olive Oil", ureg.gram, 1500.0 * 0.91),  # Through the density
+        ("Olive Oil", ureg.dimensionless, 0.0),  # Incompatible unit
+        ("Butter", ureg.gram, 0.0),  # Not in stock
+    ],
+)
+def test_total_in_unit(inventory, name, unit, expected):
+    """Test aggregated quantities per ingredient in a requested unit."""
+    assert inventory.total(name, unit) == pytest.approx(expected)
+
+
+def test_remove_updates_indexes(inventory):
+    """Test that removing items updates every index and total."""
+    removed = inventory.remove("2")
+    assert removed.inventory_id == "2"
+    assert inventory.total("olive oil", ureg.milliliter) == pytest.approx(500.0)
+    assert [i.inventory_id for i in inventory.in_location("Pantry")] == ["1"]
+    inventory.remove("1")
+    assert "olive oil" not in inventory
+    assert inventory.totals("olive oil") == {}
+    assert inventory.in_location("Pantry") == []
+    with pytest.raises(KeyError):
+        inventory.remove("1")
+
+
+def test_add_replaces_same_id_and_generates_missing_ids(inventory):
+    """Test that re-adding an id replaces it and missing ids are generated."""
+    inventory.add(item("3", "Milk", 1.0, ureg.liter, "Fridge"))
+    assert inventory.total("Milk", ureg.milliliter) == pytest.approx(1000.0)
+    stored = inventory.add(InventoryItem(name="Butter", quantity=250, unit="g"))
+    assert stored.inventory_id is not None
+    assert inventory.get(stored.inventory_id) is stored
+    assert len(inventory) == 5
+
+
+def test_fuzzy_find(inventory):
+    """Test that partial names find items and removed names stop matching."""
+    inventory.add(item("5", "Parmesan Cheese", 200.0, ureg.gram))
+    assert [i.inventory_id for i in inventory.fuzzy_find("parmesan")] == ["5"]
+    assert [i.inventory_id for i in inventory.fuzzy_find("olive", limit=1)] == [
+        "1",
+        "2",
+    ]
+    inventory.remove("5")
+    assert inventory.fuzzy_find("parmesan") == []
@@ -0,0 +1,65 @@
+"""
+Test suite for ingredient name canonicalization in names.py.
+"""
+
+import pytest
+
+from names import canonical_name, fold_text, singularize
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [("Olive Oil", "olive oil"), ("  olive   OIL ", "olive oil"), ("", "")],
+)
+def test_fold_text(raw, expected):
+    """Test that text is case-folded with collapsed whitespace."""
+    assert fold_text(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "word,expected",
+    [
+        ("eggs", "egg"),
+        ("berries", "berry"),
+        ("tomatoes", "tomato"),
+        ("peaches", "peach"),
+        ("radishes", "radish"),
+        ("boxes", "box"),
+        ("leaves", "leaf"),
+        ("molasses", "molasses"),
+        ("asparagus", "asparagus"),
+        ("glass", "glass"),
+        ("peas", "pea"),
+        ("gas", "gas"),
+        ("flour", "flour"),
+    ],
+)
+def test_singularize(word, expected):
+    """Test the plural stemming rules and their exceptions."""
+    assert singularize(word) == expected
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("Olive Oil", "olive oil"),
+        ("olive oil ", "olive oil"),
+        ("Olive oils", "olive oil"),
+        ("Spring Onions", "green onion"),
+        ("scallions", "green onion"),
+        ("All-Purpose Flour", "flour"),
+        ("Cherry  Tomatoes", "cherry tomato"),
+        ("Brussels sprouts", "brussels sprout"),
+    ],
+)
+def test_canonical_name(raw, expected):
+    """Test that spelling variants and aliases share one canonical key."""
+    assert canonical_name(raw) == expected
+
+
+def test_canonical_names_are_interned_and_cached():
+    """Test that equal keys are the same object and repeated names hit the cache."""
+    assert canonical_name("Olive Oils") is canonical_name("olive oil")
+    hits = canonical_name.cache_info().hits
+    canonical_name("Olive Oils")
+    assert canonical_name.cache_info().hits == hits + 1
@@ -0,0 +1,96 @@
+"""
+Test suite for the persistent ingredient posting index in postings.py.
+"""
+
+from array import array
+
+import pytest
+
+from postings import IngredientPostings, decode_postings, encode_postings
+
+
+@pytest.fixture
+def index(make_recipe):
+    return IngredientPostings(
+        [
+            make_recipe("piccata", "Chicken", "Lemons", "Butter"),
+            make_recipe("roast", "chicken", "Lemon", "Garlic"),
+            make_recipe("curry", "Chicken", "Cream", "Garlic"),
+            make_recipe("tart", "Lemon", "Cream", "Butter"),
+            make_recipe("salad", "Tomatoes"),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "values", [[], [0], [1, 2, 3], [0, 127, 128, 300, 100_000, 2**32 - 1]]
+)
+def test_postings_round_trip(values):
+    """Test that delta varint encoding round-trips sorted posting lists."""
+    encoded = encode_postings(values)
+    decoded, position = decode_postings(encoded)
+    assert decoded == array("I", values)
+    assert position == len(encoded)
+
+
+def test_dense_postings_take_one_byte_per_entry():
+    """Test that consecutive recipe numbers encode as single-byte gaps."""
+    assert len(encode_postings(range(1000))) == 2 + 1000
+
+
+@pytest.mark.parametrize("values", [[3, 1], [2, 2]])
+def test_encode_rejects_unsorted_postings(values):
+    """Test that posting lists must be strictly increasing."""
+    with pytest.raises(ValueError):
+        encode_postings(values)
+
+
+@pytest.mark.parametrize(
+    "include,exclude,expected",
+    [
+        (["chicken", "lemon"], [], ["piccata", "roast"]),
+        (["Chicken", "LEMONS"], ["butter"], ["roast"]),
+        (["chicken"], ["cream", "butter"], ["roast"]),
+        ([], ["chicken", "tomato"], ["tart"]),
+        (["saffron"], [], []),
+        (["garlic"], ["saffron"], ["roast", "curry"]),
+    ],
+)
+def test_query(index, include, exclude, expected):
+    """Test posting-list intersection with exclusions."""
+    assert index.query(include, exclude) == expected
+
+
+def test_updates(index, make_recipe):
+    """Test that re-added recipes keep their number and removed ones vanish."""
+    index.add(make_recipe("piccata", "Chicken", "Capers"))
+    assert index.query(["lemon"]) == ["roast", "tart"]
+    assert index.query(["chicken"]) == ["piccata", "roast", "curry"]
+    index.remove("roast")
+    assert "roast" not in index
+    assert len(index) == 4
+    assert index.postings("garlic") == array("I", [2])
+    with pytest.raises(KeyError):
+        index.remove("roast")
+
+
+def test_save_and_load(tmp_path, index, make_recipe):
+    """Test that a saved index loads back with compacted recipe numbers."""
+    index.remove("piccata")
+    path = tmp_path / "ingredients.idx"
+    index.save(path)
+    loaded = IngredientPostings.load(path)
+
+    assert len(loaded) == 4
+    assert loaded.postings("chicken") == array("I", [0, 1])
+    assert loaded.query(["lemon"], ["cream"]) == ["roast"]
+    loaded.add(make_recipe("roast", "Chicken", "Thyme"))
+    assert loaded.query(["garlic"]) == ["curry"]
+
+
+def test_load_rejects_other_files(tmp_path):
+    """Test that files without the index header raise ValueError."""
+    path = tmp_path / "other.idx"
+    path.write_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        IngredientPostings.load(path)
@@ -0,0 +1,156 @@
+"""
+Test suite for the Recipe class from model.py.
+"""
+
+import pickle
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from images import image_stat_cache
+from model import Ingredient, InventoryItem, Recipe, Step, ureg
+
+
+@pytest.fixture(autouse=True)
+def clear_image_stat_cache():
+    image_stat_cache.invalidate()
+    yield
+    image_stat_cache.invalidate()
+
+
+@pytest.fixture
+def recipe():
+    return Recipe(
+        recipe_id="pancakes",
+        name="Pancakes",
+        ingredients=[
+            Ingredient(name="Flour", quantity=750.0, unit=ureg.gram),
+            Ingredient(name="Milk", quantity=300.0, unit=ureg.milliliter),
+            Ingredient(name="Sugar", quantity=2.0, unit=ureg.teaspoon),
+            Ingredient(name="Eggs", quantity=2.0, unit=ureg.dimensionless),
+        ],
+        steps=[Step(description="Mix everything and fry.")],
+        prep_time_minutes=10,
+        cook_time_minutes=20,
+    )
+
+
+@pytest.mark.parametrize("factor", [0.5, 2.0, 4.0])
+def test_scale_multiplies_quantities(recipe, factor):
+    """Test that scaling multiplies every quantity and keeps the units."""
+    scaled = recipe.scale(factor)
+    for original, result in zip(recipe.ingredients, scaled.ingredients):
+        assert result.quantity == original.quantity * factor
+        assert result.unit == original.unit
+        assert result.name == original.name
+    assert scaled.steps == recipe.steps
+    assert recipe.ingredients[0].quantity == 750.0
+
+
+def test_scale_copies_steps(recipe):
+    """Test that scaled recipes do not share their steps list."""
+    scaled = recipe.scale(2.0)
+    scaled.steps.append(Step(description="Serve."))
+    assert len(recipe.steps) == 1
+
+
+@pytest.mark.parametrize(
+    "unit,expected",
+    [(ureg.teaspoon, ureg.teaspoon), (ureg.pinch, ureg.pinch)],
+)
+def test_scale_never_normalizes_to_pinches(unit, expected):
+    """Test that small spoon amounts stay in spoons when normalized."""
+    recipe = Recipe(
+        name="Tea",
+        ingredients=[Ingredient(name="Salt", quantity=0.25, unit=unit)],
+        steps=[],
+    )
+    assert recipe.scale(1.0, normalize=True).ingredients[0].unit == expected
+
+
+@pytest.mark.parametrize(
+    "index,quantity,unit",
+    [
+        (0, 1.5, ureg.kilogram),
+        (1, 600.0, ureg.milliliter),
+        (2, 4.0 / 3.0, ureg.tablespoon),
+        (3, 4.0, ureg.dimensionless),
+    ],
+)
+def test_scale_normalizes_units(recipe, index, quantity, unit):
+    """Test that normalized scaling picks readable units within a family."""
+    scaled = recipe.scale(2.0, normalize=True)
+    assert scaled.ingredients[index].quantity == pytest.approx(quantity)
+    assert scaled.ingredients[index].unit == unit
+
+
+@pytest.mark.parametrize("factor", [0.0, -2.0, float("nan"), float("inf")])
+def test_scale_rejects_non_positive_factor(recipe, factor):
+    """Test that non-positive and non-finite scaling factors raise ValueError."""
+    with pytest.raises(ValueError):
+        recipe.scale(factor)
+
+
+@pytest.mark.parametrize(
+    "image_path,valid",
+    [
+        ("dish.png", True),
+        ("dish.JPG", True),
+        ("missing.png", False),  # Does not exist
+        ("dish.gif", False),  # Unsupported format
+        (".", False),  # Not a file
+    ],
+)
+def test_image_path_validation(tmp_path, monkeypatch, image_path, valid):
+    """Test that image paths must be existing files of a supported format."""
+    monkeypatch.chdir(tmp_path)
+    for name in ("dish.png", "dish.JPG", "dish.gif"):
+        (tmp_path / name).touch()
+    data = {"name": "Toast", "ingredients": [], "steps": [], "image_path": image_path}
+    if valid:
+        assert Recipe(**data).image_path.name == image_path
+    else:
+        with pytest.raises(ValidationError):
+            Recipe(**data)
+
+
+def test_load_without_image_checks():
+    """Test that image checks can be skipped while other fields are validated."""
+    recipe = Recipe.load_without_image_checks(
+        {
+            "name": "Toast",
+            "ingredients": [{"name": "Bread", "quantity": 2.0, "unit": "pcs"}],
+            "steps": [{"description": "Toast the bread."}],
+            "image_path": "missing.png",
+        }
+    )
+    assert isinstance(recipe.ingredients[0], Ingredient)
+    assert recipe.ingredients[0].unit == ureg.dimensionless
+    assert isinstance(recipe.steps[0], Step)
+    assert recipe.image_path == Path("missing.png")
+    with pytest.raises(ValidationError):
+        Recipe.load_without_image_checks(
+            {"name": "Toast", "ingredients": [], "steps": [{"description": ""}]}
+        )
+
+
+def test_recipe_json_round_trip(recipe):
+    """Test that recipes round-trip through pydantic-core's JSON path."""
+    assert Recipe.model_validate_json(recipe.model_dump_json()) == recipe
+
+
+def test_recipe_pickle_round_trip(recipe):
+    """Test that unpickled recipes hold units of the shared registry."""
+    restored = pickle.loads(pickle.dumps(recipe))
+    assert restored == recipe
+    assert restored.ingredients[0].unit == ureg.gram
+    assert restored.ingredients[0].quantity_in(ureg.kilogram) == pytest.approx(0.75)
+
+
+def test_inventory_item_json_round_trip():
+    """Test that inventory items round-trip through JSON."""
+    item = InventoryItem(
+        name="Milk", quantity=1.0, unit="l", inventory_id="1", storage_location="Fridge"
+    )
+    assert InventoryItem.model_validate_json(item.model_dump_json()) == item
@@ -0,0 +1,86 @@
+"""
+Test suite for the import, export and bulk validation helpers in recipe_io.py.
+"""
+
+import pytest
+
+from model import ureg
+from recipe_io import (
+    RecordError,
+    iter_recipes_jsonl,
+    validate_recipes,
+    write_recipes_jsonl,
+)
+
+
+@pytest.fixture
+def recipes(make_recipe):
+    return [
+        make_recipe(f"recipe-{i}", ("Flour", 100.0 + i, ureg.gram)) for i in range(7)
+    ]
+
+
+@pytest.mark.parametrize("filename", ["recipes.jsonl", "recipes.jsonl.gz"])
+def test_round_trip(tmp_path, recipes, filename):
+    """Test that exported recipes stream back unchanged, with and without gzip."""
+    path = tmp_path / filename
+    assert write_recipes_jsonl(iter(recipes), path) == 7
+    assert list(iter_recipes_jsonl(path)) == recipes
+
+
+def test_gzip_output_is_compressed(tmp_path, recipes):
+    """Test that '.gz' paths are written with gzip compression."""
+    path = tmp_path / "recipes.jsonl.gz"
+    write_recipes_jsonl(recipes[:1], path)
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+
+
+def test_bad_lines_are_reported_and_skipped(tmp_path, recipes):
+    """Test that invalid lines are reported without aborting the import."""
+    path = tmp_path / "recipes.jsonl"
+    lines = [
+        recipes[0].model_dump_json(),
+        "{not json",
+        "",
+        '{"name": "No steps", "ingredients": []}',
+        recipes[1].model_dump_json(),
+    ]
+    path.write_text("\n".join(lines) + "\n")
+
+    errors = []
+    loaded = list(iter_recipes_jsonl(path, errors=errors))
+
+    assert [r.recipe_id for r in loaded] == ["recipe-0", "recipe-1"]
+    assert [e.position for e in errors] == [2, 4]
+    assert all(isinstance(e, RecordError) and e.message for e in errors)
+
+
+@pytest.mark.parametrize("skip_image_checks,expected", [(True, 1), (False, 0)])
+def test_import_can_skip_image_checks(tmp_path, skip_image_checks, expected):
+    """Test that imports can skip checking that images exist."""
+    path = tmp_path / "recipes.jsonl"
+    path.write_text(
+        '{"name": "Toast", "ingredients": [], "steps": [], "image_path": "gone.png"}\n'
+    )
+    recipes = iter_recipes_jsonl(path, skip_image_checks=skip_image_checks)
+    assert len(list(recipes)) == expected
+
+
+def test_validate_recipes_reports_errors_in_order(recipes):
+    """Test bulk validation keeps input order and reports failing indexes."""
+    records = []
+    for i, recipe in enumerate(recipes):
+        if i % 3 == 1:
+            records.append({"name": f"Broken {i}", "ingredients": []})
+        elif i % 2:
+            records.append(recipe.model_dump_json())
+        else:
+            records.append(recipe.model_dump(mode="json"))
+
+    result = validate_recipes(records)
+
+    assert [r.recipe_id for r in result.recipes] == [
+        f"recipe-{i}" for i in (0, 2, 3, 5, 6)
+    ]
+    assert result.recipes[0] == recipes[0]
+    assert [e.position for e in result.errors] == [1, 4]
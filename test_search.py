@@ -0,0 +1,132 @@
+"""
+Test suite for full-text recipe search in search.py and RecipeStore.
+"""
+
+import pytest
+
+from model import Recipe
+from search import RecipeSearchIndex, parse_query, tokenize
+from store import RecipeStore
+
+
+@pytest.fixture
+def recipes(make_recipe):
+    return [
+        make_recipe(
+            "stew",
+            name="Beef Stew",
+            description="A slow braise.",
+            steps=("Brown the beef.", "Braise in red wine for two hours."),
+        ),
+        make_recipe(
+            "salad",
+            name="Tomato Salad",
+            steps=("Slice the tomatoes.", "Dress with oil."),
+        ),
+        make_recipe(
+            "lasagna",
+            name="Lasagna",
+            description="Baked pasta.",
+            steps=("Layer the pasta and sauce.", "Bake in the oven."),
+        ),
+        make_recipe(
+            "short-ribs",
+            name="Braised Short Ribs",
+            steps=("Braise the ribs in the oven.", "Braise again."),
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Braise the onions", ["braise", "onion"]),
+        ("Slow-cooked: 2 hours!", ["slow", "cooked", "2", "hour"]),
+        ("", []),
+    ],
+)
+def test_tokenize(text, expected):
+    """Test that text is folded, split on punctuation, singularized and filtered."""
+    assert tokenize(text) == expected
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("braise", (["braise"], [])),
+        ("quick pasta no oven", (["quick", "pasta"], ["oven"])),
+        ("stew -wine without Tomatoes", (["stew"], ["wine", "tomato"])),
+    ],
+)
+def test_parse_query(query, expected):
+    """Test that '-', 'no' and 'without' mark excluded terms."""
+    assert parse_query(query) == expected
+
+
+@pytest.fixture
+def index(recipes):
+    return RecipeSearchIndex(recipes)
+
+
+def test_search_ranks_with_bm25(index):
+    """Test that repeated and title matches rank higher."""
+    assert [recipe_id for recipe_id, _ in index.search("braise")] == [
+        "short-ribs",
+        "stew",
+    ]
+    assert index.search("braise", limit=1)[0][1] > 0
+    assert index.search("sous vide") == []
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("braise no oven", ["stew"]),
+        ("braise -wine", ["short-ribs"]),
+        ("no oven", ["salad", "stew"]),
+    ],
+)
+def test_search_excludes_terms(index, query, expected):
+    """Test that excluded terms remove recipes from the results."""
+    assert sorted(recipe_id for recipe_id, _ in index.search(query)) == expected
+
+
+def test_incremental_updates(index, make_recipe):
+    """Test that recipes can be replaced and removed."""
+    index.add(make_recipe("salad", name="Green Salad", steps=("Braise the lettuce.",)))
+    assert index.search("tomato") == []
+    assert "salad" in [recipe_id for recipe_id, _ in index.search("braise")]
+    index.remove("stew")
+    assert "stew" not in index
+    assert len(index) == 3
+    assert [recipe_id for recipe_id, _ in index.search("wine")] == []
+    with pytest.raises(KeyError):
+        index.remove("stew")
+
+
+def test_search_rejects_bad_input(index):
+    """Test that recipes without ids and non-positive limits raise ValueError."""
+    with pytest.raises(ValueError):
+        index.add(Recipe(name="Anonymous", ingredients=[], steps=[]))
+    with pytest.raises(ValueError):
+        index.search("braise", limit=0)
+
+
+def test_store_full_text_search(tmp_path, recipes, make_recipe):
+    """Test that the store's FTS5 search follows the in-memory query syntax."""
+    with RecipeStore(tmp_path / "recipes.db") as store:
+        store.add_recipes(recipes)
+        assert [r for r, _ in store.search_recipes("braise")] == [
+            "short-ribs",
+            "stew",
+        ]
+        assert [r for r, _ in store.search_recipes("braise no oven")] == ["stew"]
+        assert [r for r, _ in store.search_recipes("no oven")] == ["salad", "stew"]
+
+        store.add_recipe(make_recipe("stew", name="Beef Stew", steps=("Simmer.",)))
+        assert [r for r, _ in store.search_recipes("braise")] == ["short-ribs"]
+        store.delete_recipe("short-ribs")
+        assert store.search_recipes("braise") == []
+
+    with RecipeStore(tmp_path / "recipes.db") as store:
+        assert [r for r, _ in store.search_recipes("tomato")] == ["salad"]
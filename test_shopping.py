@@ -0,0 +1,92 @@
+"""
+Test suite for shopping list aggregation in shopping.py.
+"""
+
+import pytest
+
+from inventory import Inventory
+from model import InventoryItem, ureg
+from shopping import aggregate_ingredients, shopping_list
+
+
+@pytest.fixture
+def pancakes(make_recipe):
+    return make_recipe(
+        None,
+        ("Flour", 200.0, ureg.gram),
+        ("Milk", 1.0, ureg.cup),
+        ("Eggs", 2.0, ureg.dimensionless),
+    )
+
+
+@pytest.fixture
+def bread(make_recipe):
+    return make_recipe(
+        None, ("flour", 0.5, ureg.kilogram), ("milk ", 100.0, ureg.milliliter)
+    )
+
+
+def test_aggregate_groups_by_name_and_dimensionality(pancakes, bread, make_recipe):
+    """Test that bridgeable units are summed and incompatible ones kept apart."""
+    totals = aggregate_ingredients(
+        [
+            pancakes,
+            bread,
+            make_recipe(None, ("Flour", 1.0, ureg.cup), ("Eggs", 100.0, ureg.gram)),
+            make_recipe(
+                None, ("Saffron", 1.0, ureg.gram), ("Saffron", 2.0, ureg.pinch)
+            ),
+        ]
+    )
+    assert totals == {
+        ("flour", ureg.gram): pytest.approx(700.0 + 236.5882365 * 0.53),
+        ("milk", ureg.milliliter): pytest.approx(236.5882365 + 100.0),
+        ("egg", ureg.dimensionless): pytest.approx(4.0),
+        ("saffron", ureg.gram): pytest.approx(1.0),
+        ("saffron", ureg.milliliter): pytest.approx(2 * 4.92892159375 / 16),
+    }
+
+
+def test_shopping_list_without_inventory(pancakes, bread):
+    """Test that the list is sorted by name and uses readable units."""
+    items = shopping_list([pancakes, bread, pancakes])
+    assert [(i.name, i.unit) for i in items] == [
+        ("Eggs", ureg.dimensionless),
+        ("Flour", ureg.gram),
+        ("Milk", ureg.milliliter),
+    ]
+    assert items[0].quantity == pytest.approx(4.0)
+    assert items[1].quantity == pytest.approx(900.0)
+    assert items[2].quantity == pytest.approx(2 * 236.5882365 + 100.0)
+
+
+@pytest.mark.parametrize(
+    "stock,expected",
+    [
+        ([("flour", 1.0, ureg.kilogram)], {"Eggs": 2.0, "Milk": 336.5882365}),
+        (
+            [("FLOUR", 650.0, ureg.gram), ("Eggs", 0.5, ureg.dimensionless)],
+            {"Eggs": 1.5, "Flour": 50.0, "Milk": 336.5882365},
+        ),
+        (
+            [("Milk", 300.0, ureg.gram)],
+            {"Eggs": 2.0, "Flour": 700.0, "Milk": 336.5882365 - 300.0 / 1.03},
+        ),
+        (
+            [
+                ("Milk", 2.0, ureg.cup),
+                ("Eggs", 12.0, ureg.dimensionless),
+                ("Flour", 2.0, ureg.kilogram),
+            ],
+            {},
+        ),
+    ],
+)
+def test_shopping_list_subtracts_inventory(pancakes, bread, stock, expected):
+    """Test that stock in compatible units is subtracted from the list."""
+    inventory = Inventory(
+        InventoryItem(inventory_id=str(i), name=name, quantity=quantity, unit=unit)
+        for i, (name, quantity, unit) in enumerate(stock)
+    )
+    items = shopping_list([pancakes, bread], inventory)
+    assert {i.name: i.quantity for i in items} == pytest.approx(expected)
@@ -0,0 +1,141 @@
+"""
+Test suite for the SQLite-backed RecipeStore in store.py.
+"""
+
+import sqlite3
+
+import pytest
+
+from model import InventoryItem, Recipe, ureg
+from store import RecipeStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with RecipeStore(tmp_path / "recipes.db") as store:
+        yield store
+
+
+def test_recipes_round_trip(store, make_recipe):
+    """Test that stored recipes load back unchanged, in recipe_id order."""
+    recipes = [
+        make_recipe(
+            "b",
+            "Flour",
+            "Milk",
+            description="Tasty.",
+            quantity=1.5,
+            unit=ureg.cup,
+            steps=("Mix.", "Bake."),
+            prep_time_minutes=5,
+        ),
+        make_recipe("a", "Eggs"),
+        make_recipe("c"),
+    ]
+    assert store.add_recipes(recipes, batch_size=2) == 3
+    assert store.count_recipes() == 3
+    assert store.get_recipe("b") == recipes[0]
+    assert store.get_recipe("missing") is None
+    assert list(store.iter_recipes()) == sorted(recipes, key=lambda r: r.recipe_id)
+
+
+def test_add_recipe_replaces_existing(store, make_recipe):
+    """Test that re-adding a recipe replaces its ingredients and steps."""
+    store.add_recipe(make_recipe("a", "Flour", "Milk"))
+    store.add_recipe(make_recipe("a", "Rice"))
+    assert [i.name for i in store.get_recipe("a").ingredients] == ["Rice"]
+    assert store.count_recipes() == 1
+
+
+def test_delete_recipe_cascades(store, make_recipe):
+    """Test that deleting a recipe removes its child rows."""
+    store.add_recipe(make_recipe("a", "Flour"))
+    assert store.delete_recipe("a")
+    assert not store.delete_recipe("a")
+    assert store.recipe_ids_with_ingredient("Flour") == []
+
+
+def test_recipe_ids_with_ingredient(store, make_recipe):
+    """Test looking up recipes by ingredient name."""
+    store.add_recipes(
+        [make_recipe("a", "Flour"), make_recipe("b", "Milk", "Flour"), make_recipe("c")]
+    )
+    assert store.recipe_ids_with_ingredient("Flour") == ["a", "b"]
+    assert store.recipe_ids_with_ingredient(" all-purpose FLOUR") == ["a", "b"]
+
+
+def test_older_database_is_migrated(tmp_path, make_recipe):
+    """Test that databases without canonical names are backfilled on open."""
+    path = tmp_path / "old.db"
+    with sqlite3.connect(path) as connection:
+        connection.executescript(
+            """
+            CREATE TABLE recipes (
+                recipe_id TEXT PRIMARY KEY, name TEXT NOT NULL, description TEXT,
+                prep_time_minutes INTEGER, cook_time_minutes INTEGER, image_path TEXT
+            );
+            CREATE TABLE recipe_ingredients (
+                recipe_id TEXT NOT NULL, position INTEGER NOT NULL,
+                name TEXT NOT NULL, quantity REAL NOT NULL, unit TEXT NOT NULL,
+                PRIMARY KEY (recipe_id, position)
+            );
+            CREATE INDEX idx_recipe_ingredients_name ON recipe_ingredients (name);
+            CREATE TABLE inventory (
+                inventory_id TEXT PRIMARY KEY, name TEXT NOT NULL,
+                quantity REAL NOT NULL, unit TEXT NOT NULL, storage_location TEXT
+            );
+            CREATE INDEX idx_inventory_name ON inventory (name);
+            INSERT INTO inventory VALUES ('1', 'Tomatoes', 3, 'dimensionless', NULL);
+            INSERT INTO recipes (recipe_id, name) VALUES ('a', 'Salad');
+            INSERT INTO recipe_ingredients VALUES ('a', 0, 'Tomatoes', 2, 'dimensionless');
+            """
+        )
+    connection.close()
+    with RecipeStore(path) as store:
+        assert store.recipe_ids_with_ingredient("tomato") == ["a"]
+        assert store.get_recipe("a").ingredients[0].name == "Tomatoes"
+        assert [r for r, _ in store.search_recipes("salad")] == ["a"]
+        store.add_recipe(make_recipe("b", "Tomato"))
+        assert store.recipe_ids_with_ingredient("Tomatoes") == ["a", "b"]
+        (item,) = store.inventory_items_with_name("tomato")
+        assert item.inventory_id == "1"
+
+
+def test_recipe_without_id_is_rejected(store):
+    """Test that recipes need a recipe_id to be stored."""
+    with pytest.raises(ValueError):
+        store.add_recipe(Recipe(name="Anonymous", ingredients=[], steps=[]))
+
+
+def test_inventory_round_trip(store):
+    """Test storing, loading and deleting inventory items."""
+    items = [
+        InventoryItem(
+            inventory_id="1",
+            name="Milk",
+            quantity=1.0,
+            unit="l",
+            storage_location="Fridge",
+        ),
+        InventoryItem(
+            inventory_id="2", name="Eggs", quantity=6.0, unit="dimensionless"
+        ),
+    ]
+    assert store.add_inventory_items(items) == 2
+    assert store.get_inventory_item("1") == items[0]
+    assert list(store.iter_inventory()) == items
+    assert store.inventory_items_with_name("milks") == [items[0]]
+    assert store.delete_inventory_item("2")
+    assert store.get_inventory_item("2") is None
+
+
+def test_database_uses_wal_and_indexes(tmp_path):
+    """Test that the database runs in WAL mode with the lookup indexes."""
+    path = tmp_path / "recipes.db"
+    RecipeStore(path).close()
+    connection = sqlite3.connect(path)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+    assert {"idx_recipe_ingredients_name_key", "idx_inventory_name_key"} <= indexes
+    assert "idx_inventory_name" not in indexes
+    connection.close()
@@ -0,0 +1,204 @@
+"""
+Test suite for the image metadata and thumbnail cache in thumbnails.py.
+"""
+
+import os
+import struct
+import zlib
+
+import pytest
+
+from thumbnails import ThumbnailCache, read_image_metadata
+
+
+def png_bytes(width: int, height: int) -> bytes:
+    """Builds a minimal valid grayscale PNG."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    raw = b"".join(b"\x00" + b"\x00" * width for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", ihdr)
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def jpeg_bytes(width: int, height: int) -> bytes:
+    """Builds a JPEG header with an APP0 segment followed by a SOF0 segment."""
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof0 = (
+        b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 1) + b"\x01\x11\x00"
+    )
+    return b"\xff\xd8" + app0 + sof0 + b"\xff\xd9"
+
+
+def webp_bytes(width: int, height: int) -> bytes:
+    """Builds an extended (VP8X) WebP header."""
+    vp8x = (
+        b"VP8X"
+        + struct.pack("<I", 10)
+        + b"\x00\x00\x00\x00"
+        + (width - 1).to_bytes(3, "little")
+        + (height - 1).to_bytes(3, "little")
+    )
+    return b"RIFF" + struct.pack("<I", 4 + len(vp8x)) + b"WEBP" + vp8x
+
+
+@pytest.mark.parametrize(
+    "filename,data,image_format",
+    [
+        ("a.png", png_bytes(40, 30), "png"),
+        ("a.jpg", jpeg_bytes(640, 480), "jpeg"),
+        ("a.webp", webp_bytes(1920, 1080), "webp"),
+    ],
+)
+def test_read_image_metadata(tmp_path, filename, data, image_format):
+    """Test that dimensions and format are read from image headers."""
+    path = tmp_path / filename
+    path.write_bytes(data)
+    metadata = read_image_metadata(path)
+    assert metadata.format == image_format
+    assert metadata.size_bytes == len(data)
+    assert (metadata.width, metadata.height) == {
+        "png": (40, 30),
+        "jpeg": (640, 480),
+        "webp": (1920, 1080),
+    }[image_format]
+
+
+@pytest.mark.parametrize("data", [b"GIF89a" + b"\x00" * 30, b"\xff\xd8\xff", b""])
+def test_read_image_metadata_rejects_unsupported(tmp_path, data):
+    """Test that unsupported or truncated images raise ValueError."""
+    path = tmp_path / "bad.png"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        read_image_metadata(path)
+
+
+class CountingThumbnailer:
+    def __init__(self, size_bytes: int = 100):
+        self.calls = 0
+        self.size_bytes = size_bytes
+
+    def __call__(self, path, size):
+        self.calls += 1
+        return b"t" * self.size_bytes
+
+
+def test_cache_hit_skips_original_image(tmp_path):
+    """Test that cached entries are served without re-reading the image."""
+    image = tmp_path / "dish.png"
+    image.write_bytes(png_bytes(8, 8))
+    thumbnailer = CountingThumbnailer()
+    cache = ThumbnailCache(tmp_path / "cache", thumbnailer=thumbnailer)
+
+    assert cache.thumbnail(image) == b"t" * 100
+    assert cache.metadata(image).width == 8
+    assert thumbnailer.calls == 1
+
+    reopened = ThumbnailCache(tmp_path / "cache", thumbnailer=thumbnailer)
+    assert reopened.metadata(image).height == 8
+    assert reopened.total_bytes == cache.total_bytes
+    assert thumbnailer.calls == 1
+
+
+def test_modified_image_gets_new_entry(tmp_path):
+    """Test that changing the image's mtime invalidates its cache entry."""
+    image = tmp_path / "dish.png"
+    image.write_bytes(png_bytes(8, 8))
+    cache = ThumbnailCache(tmp_path / "cache", thumbnailer=CountingThumbnailer())
+    assert cache.metadata(image).width == 8
+
+    image.write_bytes(png_bytes(16, 8))
+    stat = image.stat()
+    os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.metadata(image).width == 16
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Test that the cache stays under max_bytes by evicting the LRU entry."""
+    images = []
+    for name in ("a", "b", "c"):
+        image = tmp_path / f"{name}.png"
+        image.write_bytes(png_bytes(4, 4))
+        images.append(image)
+    thumbnailer = CountingThumbnailer(size_bytes=1000)
+    cache = ThumbnailCache(tmp_path / "cache", max_bytes=2500, thumbnailer=thumbnailer)
+
+    cache.thumbnail(images[0])
+    cache.thumbnail(images[1])
+    cache.thumbnail(images[0])  # Touch "a" so "b" is least recently used
+    cache.thumbnail(images[2])
+
+    assert cache.total_bytes <= 2500
+    assert thumbnailer.calls == 3
+    cache.thumbnail(images[0])
+    assert thumbnailer.calls == 3
+    cache.thumbnail(images[1])
+    assert thumbnailer.calls == 4
+
+
+@pytest.mark.parametrize("suffixes", [(".json", ".thumb"), (".thumb",)])
+def test_files_deleted_by_another_process_are_misses(tmp_path, suffixes):
+    """Test that entries whose files were deleted behind the index are rebuilt."""
+    image = tmp_path / "dish.png"
+    image.write_bytes(png_bytes(8, 8))
+    thumbnailer = CountingThumbnailer()
+    cache = ThumbnailCache(tmp_path / "cache", thumbnailer=thumbnailer)
+    cache.thumbnail(image)
+    total_bytes = cache.total_bytes
+
+    for suffix in suffixes:
+        for file in (tmp_path / "cache").glob(f"*{suffix}"):
+            file.unlink()
+
+    assert cache.metadata(image).width == 8
+    assert cache.thumbnail(image) == b"t" * 100
+    assert thumbnailer.calls == 2
+    assert cache.total_bytes == total_bytes
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
+def test_without_thumbnailer_only_metadata_is_cached(tmp_path):
+    """Test that thumbnails are None when no thumbnailer is available."""
+    image = tmp_path / "dish.png"
+    image.write_bytes(png_bytes(8, 8))
+    cache = ThumbnailCache(tmp_path / "cache")
+    cache.thumbnailer = None
+    assert cache.thumbnail(image) is None
+    assert cache.metadata(image).format == "png"
+
+
+def test_metadata_only_entry_gets_thumbnail_later(tmp_path):
+    """Test that entries cached without a thumbnailer are upgraded on request."""
+    image = tmp_path / "dish.png"
+    image.write_bytes(png_bytes(8, 8))
+    cache = ThumbnailCache(tmp_path / "cache")
+    cache.thumbnailer = None
+    assert cache.thumbnail(image) is None
+
+    thumbnailer = CountingThumbnailer()
+    reopened = ThumbnailCache(tmp_path / "cache", thumbnailer=thumbnailer)
+    assert reopened.thumbnail(image) == b"t" * 100
+    assert reopened.thumbnail(image) == b"t" * 100
+    assert thumbnailer.calls == 1
+    assert reopened.total_bytes == cache.total_bytes + 100
+
+
+def test_metadata_does_not_need_a_thumbnail(tmp_path):
+    """Test that metadata is served even if thumbnailing fails."""
+
+    def failing_thumbnailer(path, size):
+        raise OSError("cannot decode")
+
+    image = tmp_path / "dish.png"
+    image.write_bytes(png_bytes(8, 8))
+    cache = ThumbnailCache(tmp_path / "cache", thumbnailer=failing_thumbnailer)
+    assert cache.metadata(image).width == 8
+    with pytest.raises(OSError):
+        cache.thumbnail(image)
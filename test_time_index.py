@@ -0,0 +1,99 @@
+"""
+Test suite for the sorted recipe time index in time_index.py.
+"""
+
+import pytest
+
+from model import Recipe
+from postings import IngredientPostings
+from time_index import RecipeTimeIndex
+
+
+@pytest.fixture
+def recipes(make_recipe):
+    times = {
+        "toast": (2, 3, "Bread", "Butter"),
+        "omelette": (5, 10, "Eggs", "Butter"),
+        "stew": (20, 120, "Beef", "Onions"),
+        "salad": (10, None, "Tomatoes", "Onion"),
+        "pancakes": (10, 15, "Eggs", "Flour"),
+        "mystery": (None, None),
+    }
+    return [
+        make_recipe(recipe_id, *names, prep_time_minutes=prep, cook_time_minutes=cook)
+        for recipe_id, (prep, cook, *names) in times.items()
+    ]
+
+
+@pytest.fixture
+def index(recipes):
+    return RecipeTimeIndex(recipes)
+
+
+def ids(recipes):
+    return [r.recipe_id for r in recipes]
+
+
+@pytest.mark.parametrize(
+    "minimum,maximum,field,expected",
+    [
+        (None, 30, "total", ["mystery", "toast", "salad", "omelette", "pancakes"]),
+        (10, 25, "total", ["salad", "omelette", "pancakes"]),
+        (None, None, "cook", ["toast", "omelette", "pancakes", "stew"]),
+        (10, 10, "prep", ["pancakes", "salad"]),
+        (200, None, "total", []),
+        (30, 10, "total", []),
+    ],
+)
+def test_between(index, minimum, maximum, field, expected):
+    """Test inclusive range queries on each time field, fastest first."""
+    assert ids(index.between(minimum, maximum, field)) == expected
+
+
+@pytest.mark.parametrize(
+    "maximum,ingredients,expected",
+    [
+        (30, ["butter"], ["toast", "omelette"]),
+        (30, ["EGGS", "flour"], ["pancakes"]),
+        (None, ["onion"], ["salad", "stew"]),
+        (30, ["saffron"], []),
+        (5, ["eggs"], []),
+    ],
+)
+def test_between_with_ingredients(recipes, index, maximum, ingredients, expected):
+    """Test that range queries combine with ingredient posting list queries."""
+    candidates = IngredientPostings(recipes).query(include=ingredients)
+    assert ids(index.between(maximum=maximum, candidates=candidates)) == expected
+
+
+def test_between_ignores_unknown_candidates(index):
+    """Test that candidate ids missing from the index are skipped."""
+    assert ids(index.between(candidates=["salad", "gone"])) == ["salad"]
+
+
+def test_updates_keep_index_sorted(index, make_recipe):
+    """Test that replaced and removed recipes leave no stale entries."""
+    index.add(make_recipe("stew", "Beef", prep_time_minutes=10, cook_time_minutes=15))
+    assert ids(index.between(maximum=25)) == [
+        "mystery",
+        "toast",
+        "salad",
+        "omelette",
+        "pancakes",
+        "stew",
+    ]
+    assert ids(index.between(candidates=["salad", "stew"])) == ["salad", "stew"]
+    assert index.remove("toast").recipe_id == "toast"
+    assert "toast" not in index
+    assert len(index) == 5
+    assert ids(index.between(maximum=5)) == ["mystery"]
+    with pytest.raises(KeyError):
+        index.remove("toast")
+
+
+def test_rejects_bad_input(index):
+    """Test that recipes without ids and unknown fields raise ValueError."""
+    with pytest.raises(ValueError):
+        index.add(Recipe(name="Anonymous", ingredients=[], steps=[]))
+    with pytest.raises(ValueError):
+        index.between(maximum=30, field="rest")
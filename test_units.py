@@ -0,0 +1,184 @@
+"""
+Test suite for the unit registry helpers in units.py.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from pint import DimensionalityError
+from pydantic import ValidationError
+
+import model
+import units
+
+
+def test_importing_model_does_not_build_registry():
+    """Test that importing model leaves the shared registry unbuilt."""
+    code = "import model, units; print(units._registry is None)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True"
+
+
+@pytest.mark.parametrize("module", [units, model])
+def test_ureg_attribute_returns_shared_registry(module):
+    """Test that module-level ureg access returns the shared registry."""
+    assert module.ureg is units.get_registry()
+
+
+def test_unknown_module_attribute_raises():
+    """Test that unknown module attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        units.not_a_registry
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "gram",
+        "kilogram",
+        "milliliter",
+        "cup",
+        "teaspoon",
+        "tablespoon",
+        "ounce",
+        "pound",
+        "pinch",
+        "dimensionless",
+    ],
+)
+def test_kitchen_units_are_accepted(name):
+    """Test that culinary units pass the kitchen registry check."""
+    unit = units.get_registry().parse_units(name)
+    assert units.check_kitchen_unit(unit) == unit
+
+
+@pytest.mark.parametrize("name", ["meter", "kelvin", "second", "gram / meter"])
+def test_non_kitchen_units_are_rejected(name):
+    """Test that non-culinary units fail the kitchen registry check."""
+    with pytest.raises(ValueError, match="not a supported kitchen unit"):
+        units.check_kitchen_unit(units.get_registry().parse_units(name))
+
+
+@pytest.mark.parametrize(
+    "source,target",
+    [
+        ("cup", "milliliter"),
+        ("tablespoon", "teaspoon"),
+        ("pound", "gram"),
+        ("ounce", "kilogram"),
+        ("pinch", "milliliter"),
+    ],
+)
+def test_kitchen_registry_matches_default_conversions(source, target):
+    """Test that kitchen definitions agree with the shared registry."""
+    kitchen = units.get_kitchen_registry().Quantity(1, source).to(target)
+    shared = units.get_registry().Quantity(1, source).to(target)
+    assert kitchen.magnitude == pytest.approx(shared.magnitude)
+
+
+@pytest.mark.parametrize(
+    "unit_name,kitchen_only,valid",
+    [
+        ("gram", True, True),
+        ("meter", True, False),
+        ("meter", False, True),
+    ],
+)
+def test_ingredient_kitchen_units_only_context(unit_name, kitchen_only, valid):
+    """Test that Ingredient enforces kitchen units only when asked to."""
+    data = {
+        "name": "Test",
+        "quantity": 1.0,
+        "unit": units.get_registry().parse_units(unit_name),
+    }
+    context = {"kitchen_units_only": kitchen_only}
+    if valid:
+        assert (
+            model.Ingredient.model_validate(data, context=context).unit == data["unit"]
+        )
+    else:
+        with pytest.raises(ValidationError):
+            model.Ingredient.model_validate(data, context=context)
+
+
+@pytest.mark.parametrize(
+    "source,target,expected",
+    [
+        ("kilogram", "gram", 1000.0),
+        ("cup", "milliliter", 236.5882365),
+        ("tablespoon", "teaspoon", 3.0),
+        ("pound", "ounce", 16.0),
+        ("gram", "gram", 1.0),
+        ("meter", "centimeter", 100.0),  # Outside the precomputed table
+    ],
+)
+def test_conversion_factor_values(source, target, expected):
+    """Test that cached conversion factors match the expected values."""
+    registry = units.get_registry()
+    factor = units.conversion_factor(
+        registry.parse_units(source), registry.parse_units(target)
+    )
+    assert factor == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "source,target,error",
+    [
+        ("gram", "milliliter", DimensionalityError),
+        ("cup", "dimensionless", DimensionalityError),
+        ("degC", "kelvin", ValueError),
+    ],
+)
+def test_conversion_factor_rejects_invalid_pairs(source, target, error):
+    """Test that incompatible or offset units cannot be converted by factor."""
+    registry = units.get_registry()
+    with pytest.raises(error):
+        units.conversion_factor(
+            registry.parse_units(source), registry.parse_units(target)
+        )
+
+
+def test_convert_uses_factor():
+    """Test that convert scales a magnitude by the conversion factor."""
+    registry = units.get_registry()
+    assert units.convert(2.5, registry.kilogram, registry.gram) == pytest.approx(2500)
+
+
+@pytest.mark.parametrize(
+    "magnitude,unit,expected_magnitude,expected_unit",
+    [
+        (1500.0, "gram", 1.5, "kilogram"),
+        (0.5, "kilogram", 500.0, "gram"),
+        (48.0, "teaspoon", 1.0, "cup"),
+        (0.5, "teaspoon", 0.5, "teaspoon"),
+        (0.25, "teaspoon", 0.25, "teaspoon"),
+        (16.0, "pinch", 16.0, "pinch"),
+        (20.0, "ounce", 1.25, "pound"),
+        (3.0, "dimensionless", 3.0, "dimensionless"),
+        (5.0, "meter", 5.0, "meter"),
+    ],
+)
+def test_normalize_quantity(magnitude, unit, expected_magnitude, expected_unit):
+    """Test that quantities are re-expressed in a readable unit of their family."""
+    result, result_unit = units.normalize_quantity(magnitude, units.parse_unit(unit))
+    assert result == pytest.approx(expected_magnitude)
+    assert result_unit == units.parse_unit(expected_unit)
+
+
+@pytest.mark.parametrize(
+    "unit,expected",
+    [
+        ("kilogram", "gram"),
+        ("pound", "gram"),
+        ("cup", "milliliter"),
+        ("liter", "milliliter"),
+        ("dimensionless", "dimensionless"),
+        ("foot", "meter"),
+    ],
+)
+def test_canonical_unit(unit, expected):
+    """Test that each dimensionality maps to its aggregation unit."""
+    assert units.canonical_unit(units.parse_unit(unit)) == units.parse_unit(expected)
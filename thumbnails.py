@@ -0,0 +1,303 @@
+"""
+On-disk cache of image metadata and thumbnails for recipe images.
+
+Listing pages only need an image's dimensions and a small preview, so both are
+cached on local disk, keyed by the image path plus its modification time and
+size: editing an image produces a new key and the stale entry ages out. The
+cache is bounded by total size and evicts the least recently used entries.
+
+Dimensions and format are read from the file header with the standard
+library. Downscaling needs an image library, so thumbnails are produced by a
+pluggable ``thumbnailer``; by default Pillow is used if it is installed, and
+otherwise only metadata is cached.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+# Creates a thumbnail no larger than the given size from an image, as bytes.
+Thumbnailer = Callable[[Path, int], bytes]
+
+# JPEG start-of-frame markers, which carry the image dimensions.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+class ImageMetadata(BaseModel):
+    """
+    Dimensions and format of an image file, as read from its header.
+    """
+
+    width: int = Field(..., gt=0, description="Image width in pixels.")
+    height: int = Field(..., gt=0, description="Image height in pixels.")
+    format: str = Field(..., description="Image format: 'jpeg', 'png' or 'webp'.")
+    size_bytes: int = Field(..., ge=0, description="Size of the image file in bytes.")
+
+
+def _read_jpeg_size(file: BinaryIO) -> Tuple[int, int]:
+    """Walks JPEG segments until a start-of-frame marker and returns (width, height)."""
+    file.seek(2)
+    while True:
+        byte = file.read(1)
+        while byte == b"\xff":
+            byte = file.read(1)
+        if not byte:
+            raise ValueError("JPEG ended before a start-of-frame marker.")
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue
+        (length,) = struct.unpack(">H", file.read(2))
+        if marker in _JPEG_SOF_MARKERS:
+            _, height, width = struct.unpack(">BHH", file.read(5))
+            return width, height
+        file.seek(length - 2, os.SEEK_CUR)
+
+
+def _read_webp_size(header: bytes) -> Tuple[int, int]:
+    """Returns (width, height) from the first chunk of a WebP file."""
+    chunk = header[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        (bits,) = struct.unpack("<I", header[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(header[24:27], "little") + 1
+        height = int.from_bytes(header[27:30], "little") + 1
+        return width, height
+    raise ValueError(f"Unsupported WebP chunk: {chunk!r}")
+
+
+def read_image_metadata(path: Union[str, Path]) -> ImageMetadata:
+    """
+    Reads the dimensions and format of a JPEG, PNG or WebP file from its header.
+
+    Only the header is read, never the full image data.
+
+    Args:
+        path: The image file.
+
+    Returns:
+        ImageMetadata: The image's dimensions, format and file size.
+
+    Raises:
+        ValueError: If the file is not a supported or well-formed image.
+    """
+    path = Path(path)
+    with open(path, "rb") as file:
+        header = file.read(32)
+        try:
+            if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", header[16:24])
+                image_format = "png"
+            elif header.startswith(b"\xff\xd8"):
+                width, height = _read_jpeg_size(file)
+                image_format = "jpeg"
+            elif header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+                width, height = _read_webp_size(header)
+                image_format = "webp"
+            else:
+                raise ValueError("Unrecognized image signature.")
+        except struct.error as e:
+            raise ValueError(f"Truncated image header: {path}") from e
+    return ImageMetadata(
+        width=width,
+        height=height,
+        format=image_format,
+        size_bytes=path.stat().st_size,
+    )
+
+
+def pillow_thumbnail(path: Path, size: int) -> bytes:
+    """
+    Creates a PNG thumbnail that fits in a ``size`` x ``size`` box using Pillow.
+
+    Args:
+        path: The source image.
+        size: The maximum width and height of the thumbnail.
+
+    Returns:
+        bytes: The encoded PNG thumbnail.
+    """
+    from io import BytesIO
+
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image.thumbnail((size, size))
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _default_thumbnailer() -> Optional[Thumbnailer]:
+    """Returns ``pillow_thumbnail`` if Pillow is installed, otherwise None."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return None
+    return pillow_thumbnail
+
+
+class ThumbnailCache:
+    """
+    A size-bounded, least-recently-used disk cache of image metadata and thumbnails.
+
+    Each entry is stored as ``<key>.json`` (metadata) and, once a thumbnail
+    was requested with a thumbnailer available, ``<key>.thumb`` (thumbnail
+    bytes) in ``cache_dir``. File
+    modification times record recency, so LRU order survives restarts.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_bytes: int = 64 * 1024 * 1024,
+        thumbnail_size: int = 256,
+        thumbnailer: Optional[Thumbnailer] = None,
+    ):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be greater than 0. Got: {max_bytes}")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.thumbnail_size = thumbnail_size
+        self.thumbnailer = (
+            thumbnailer if thumbnailer is not None else _default_thumbnailer()
+        )
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Rebuilds the in-memory LRU index from the files in the cache directory."""
+        sizes = {}
+        recency = {}
+        for file in self.cache_dir.iterdir():
+            if file.suffix in (".json", ".thumb"):
+                stat = file.stat()
+                sizes[file.stem] = sizes.get(file.stem, 0) + stat.st_size
+                recency[file.stem] = max(recency.get(file.stem, 0), stat.st_mtime_ns)
+        for key in sorted(sizes, key=recency.__getitem__):
+            self._entries[key] = sizes[key]
+            self._total_bytes += sizes[key]
+
+    def _key(self, path: Path) -> str:
+        """Returns the cache key for the current version of an image."""
+        stat = path.stat()
+        raw = f"{path.resolve()}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _touch(self, key: str) -> None:
+        """Marks an entry as most recently used, in memory and on disk."""
+        self._entries.move_to_end(key)
+        for suffix in (".json", ".thumb"):
+            file = self.cache_dir / f"{key}{suffix}"
+            if file.exists():
+                os.utime(file)
+
+    def _drop(self, key: str) -> None:
+        """Removes an entry from the index and deletes whatever is left of its files."""
+        self._total_bytes -= self._entries.pop(key, 0)
+        for suffix in (".json", ".thumb"):
+            (self.cache_dir / f"{key}{suffix}").unlink(missing_ok=True)
+
+    def _write(self, key: str, suffix: str, data: bytes) -> None:
+        """Writes one file of an entry and evicts LRU entries beyond ``max_bytes``."""
+        (self.cache_dir / f"{key}{suffix}").write_bytes(data)
+        self._entries[key] = self._entries.get(key, 0) + len(data)
+        self._entries.move_to_end(key)
+        self._total_bytes += len(data)
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            self._drop(next(iter(self._entries)))
+
+    def _lookup(self, path: Path) -> Tuple[str, ImageMetadata]:
+        """
+        Returns the key and metadata of ``path``'s entry, creating it if needed.
+
+        The image header is read without holding the lock, so slow files do
+        not block lookups of other images. An indexed entry whose file is gone,
+        e.g. because another process sharing ``cache_dir`` evicted it, is
+        dropped and treated as a miss.
+        """
+        key = self._key(path)
+        with self._lock:
+            if key in self._entries:
+                try:
+                    data = (self.cache_dir / f"{key}.json").read_bytes()
+                except FileNotFoundError:
+                    self._drop(key)
+                else:
+                    self._touch(key)
+                    return key, ImageMetadata.model_validate_json(data)
+        metadata = read_image_metadata(path)
+        with self._lock:
+            if key not in self._entries:
+                self._write(key, ".json", metadata.model_dump_json().encode())
+        return key, metadata
+
+    def metadata(self, path: Union[str, Path]) -> ImageMetadata:
+        """
+        Returns the cached metadata of an image, reading its header on a miss.
+
+        Never creates a thumbnail, so it works whether or not one can be made.
+
+        Args:
+            path: The image file.
+
+        Returns:
+            ImageMetadata: The image's dimensions, format and file size.
+
+        Raises:
+            ValueError: If the file is not a supported or well-formed image.
+        """
+        return self._lookup(Path(path))[1]
+
+    def thumbnail(self, path: Union[str, Path]) -> Optional[bytes]:
+        """
+        Returns the cached thumbnail of an image, creating it on a miss.
+
+        Entries cached without a thumbnail, e.g. while no thumbnailer was
+        available, get one the first time it is requested with a thumbnailer.
+
+        Args:
+            path: The image file.
+
+        Returns:
+            Optional[bytes]: The thumbnail, or None if no thumbnailer is available.
+
+        Raises:
+            ValueError: If the file is not a supported or well-formed image.
+        """
+        path = Path(path)
+        key, metadata = self._lookup(path)
+        file = self.cache_dir / f"{key}.thumb"
+        with self._lock:
+            try:
+                return file.read_bytes()
+            except FileNotFoundError:
+                pass
+        if self.thumbnailer is None:
+            return None
+        thumbnail = self.thumbnailer(path, self.thumbnail_size)
+        with self._lock:
+            # The entry may have been evicted, or lost its thumbnail to another
+            # process, while the thumbnail was made: rewrite it from scratch so
+            # its size is counted once.
+            self._drop(key)
+            self._write(key, ".json", metadata.model_dump_json().encode())
+            self._write(key, ".thumb", thumbnail)
+        return thumbnail
+
+    @property
+    def total_bytes(self) -> int:
+        """The total size of all cached entries, in bytes."""
+        return self._total_bytes
@@ -0,0 +1,155 @@
+"""
+Sorted index of recipes by preparation, cooking and total time.
+
+``RecipeTimeIndex`` keeps one list of ``(minutes, recipe_id)`` pairs per time
+field, sorted at all times, so "recipes under 30 minutes" is two binary
+searches and a slice instead of a scan calling ``Recipe.get_total_time`` on
+the whole catalogue. Recipes are inserted and removed with ``bisect``. Range
+queries can be restricted to candidate recipe ids, e.g. from
+``postings.IngredientPostings.query`` to combine them with ingredient filters.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
+
+from model import Recipe
+
+TimeField = Literal["total", "prep", "cook"]
+
+# The indexed fields; recipes without a prep or cook time are left out of that
+# field's index, while their total counts missing times as 0.
+TIME_FIELDS = ("total", "prep", "cook")
+
+_minutes = itemgetter(0)
+
+
+def recipe_times(recipe: Recipe) -> Dict[str, Optional[int]]:
+    """
+    Returns the indexed times of a recipe.
+
+    Args:
+        recipe: The recipe.
+
+    Returns:
+        Dict[str, Optional[int]]: Minutes per field in ``TIME_FIELDS``; None
+        if the recipe does not specify that time.
+    """
+    return {
+        "total": recipe.get_total_time(),
+        "prep": recipe.prep_time_minutes,
+        "cook": recipe.cook_time_minutes,
+    }
+
+
+class RecipeTimeIndex:
+    """
+    A sorted, incrementally maintained index of recipe times by ``recipe_id``.
+    """
+
+    def __init__(self, recipes: Iterable[Recipe] = ()):
+        self._recipes: Dict[str, Recipe] = {}
+        self._sorted: Dict[str, List[Tuple[int, str]]] = {
+            field: [] for field in TIME_FIELDS
+        }
+        for recipe in recipes:
+            self.add(recipe)
+
+    def add(self, recipe: Recipe) -> None:
+        """
+        Indexes a recipe, replacing any recipe with the same ``recipe_id``.
+
+        Args:
+            recipe: The recipe to index.
+
+        Raises:
+            ValueError: If the recipe has no recipe_id.
+        """
+        recipe_id = recipe.recipe_id
+        if recipe_id is None:
+            raise ValueError(f"Recipe '{recipe.name}' has no recipe_id to index.")
+        if recipe_id in self._recipes:
+            self.remove(recipe_id)
+        self._recipes[recipe_id] = recipe
+        for field, minutes in recipe_times(recipe).items():
+            if minutes is not None:
+                insort(self._sorted[field], (minutes, recipe_id))
+
+    def remove(self, recipe_id: str) -> Recipe:
+        """
+        Removes a recipe from the index.
+
+        Args:
+            recipe_id: The id of the recipe to remove.
+
+        Returns:
+            Recipe: The removed recipe.
+
+        Raises:
+            KeyError: If no recipe with this id is indexed.
+        """
+        recipe = self._recipes.pop(recipe_id)
+        for field, minutes in recipe_times(recipe).items():
+            if minutes is not None:
+                entries = self._sorted[field]
+                del entries[bisect_left(entries, (minutes, recipe_id))]
+        return recipe
+
+    def __contains__(self, recipe_id: str) -> bool:
+        return recipe_id in self._recipes
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def between(
+        self,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+        field: TimeField = "total",
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[Recipe]:
+        """
+        Returns the recipes whose time lies in a range, fastest first.
+
+        Args:
+            minimum: The inclusive lower bound in minutes; None for no bound.
+            maximum: The inclusive upper bound in minutes; None for no bound.
+            field: Which time to query: "total", "prep" or "cook".
+            candidates: If given, only these recipe ids are returned, e.g. the
+                result of ``IngredientPostings.query``; ids that are not
+                indexed are ignored.
+
+        Returns:
+            List[Recipe]: The matching recipes, ordered by time, then by recipe_id.
+
+        Raises:
+            ValueError: If field is not one of ``TIME_FIELDS``.
+        """
+        if field not in self._sorted:
+            raise ValueError(f"field must be one of {TIME_FIELDS}. Got: '{field}'")
+        entries = self._sorted[field]
+        low = 0 if minimum is None else bisect_left(entries, minimum, key=_minutes)
+        high = (
+            len(entries)
+            if maximum is None
+            else bisect_right(entries, maximum, key=_minutes)
+        )
+        if candidates is None:
+            return [self._recipes[recipe_id] for _, recipe_id in entries[low:high]]
+        allowed = {recipe_id for recipe_id in candidates if recipe_id in self._recipes}
+        if len(allowed) < high - low:
+            # Fewer candidates than entries in range: look their times up instead.
+            times = {
+                recipe_id: recipe_times(self._recipes[recipe_id])[field]
+                for recipe_id in allowed
+            }
+            matches = sorted(
+                (minutes, recipe_id)
+                for recipe_id, minutes in times.items()
+                if minutes is not None
+                and (minimum is None or minutes >= minimum)
+                and (maximum is None or minutes <= maximum)
+            )
+        else:
+            matches = [entry for entry in entries[low:high] if entry[1] in allowed]
+        return [self._recipes[recipe_id] for _, recipe_id in matches]
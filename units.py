@@ -0,0 +1,389 @@
+"""
+Unit registry management for Appetise.
+
+Building a Pint ``UnitRegistry`` means parsing Pint's full definition files,
+which dominates start-up time. The registry is therefore created lazily, on
+first access, and Pint's on-disk definition cache is enabled so that later
+processes load a pre-parsed registry instead of re-reading the definitions.
+"""
+
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated, Dict, Optional, Tuple
+
+from pint import Unit, UnitRegistry, set_application_registry
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+# Folder used by Pint to cache parsed unit definitions between processes.
+# ":auto:" selects the per-user cache directory; set the environment
+# variable to an empty string to disable the on-disk cache entirely.
+UNIT_CACHE_FOLDER = os.environ.get("APPETISE_UNIT_CACHE", ":auto:")
+
+# Project-defined definitions file for the trimmed kitchen registry.
+KITCHEN_UNITS_FILE = Path(__file__).with_name("kitchen_units.txt")
+
+# Culinary units missing from Pint's defaults (Pint reads "pinch" as picoinch).
+EXTRA_DEFINITIONS = ("pinch = teaspoon / 16",)
+
+# Units covered by the precomputed conversion-factor table.
+KITCHEN_UNIT_NAMES = (
+    "gram",
+    "kilogram",
+    "ounce",
+    "pound",
+    "milliliter",
+    "liter",
+    "teaspoon",
+    "tablespoon",
+    "cup",
+    "pinch",
+    "dimensionless",
+)
+
+# Families of interchangeable units, smallest first, used to pick a
+# "nice" unit when normalizing scaled quantities. Units stay in their own
+# family so metric amounts are never turned into US customary ones.
+NICE_UNIT_LADDERS = (
+    ("gram", "kilogram"),
+    ("ounce", "pound"),
+    ("milliliter", "liter"),
+    ("teaspoon", "tablespoon", "cup"),
+)
+
+# Kitchen spellings Pint does not parse, or parses as something else
+# (e.g. "c" is the speed of light and "pinches" is pico-inches).
+# Keys are matched exactly, then against the lower-cased string, before Pint
+# sees it: ingredient units are kitchen amounts, so "Ml" is milliliters and
+# "T" a tablespoon, never megaliters or teslas.
+UNIT_ALIASES = {
+    "g": "gram",
+    "kg": "kilogram",
+    "ml": "milliliter",
+    "l": "liter",
+    "tsp": "teaspoon",
+    "tsp.": "teaspoon",
+    "tsps": "teaspoon",
+    "tbsp": "tablespoon",
+    "tbsp.": "tablespoon",
+    "tbsps": "tablespoon",
+    "tbs": "tablespoon",
+    "t": "teaspoon",
+    "T": "tablespoon",
+    "c": "cup",
+    "oz": "ounce",
+    "fl oz": "fluid_ounce",
+    "lb": "pound",
+    "lbs": "pound",
+    "pinch": "pinch",
+    "pinches": "pinch",
+    "each": "dimensionless",
+    "piece": "dimensionless",
+    "pieces": "dimensionless",
+    "pcs": "dimensionless",
+    "whole": "dimensionless",
+}
+
+# Maximum number of distinct unit strings kept by the parse cache.
+UNIT_PARSE_CACHE_SIZE = 1024
+
+_registry: Optional[UnitRegistry] = None
+_kitchen_registry: Optional[UnitRegistry] = None
+_registry_lock = threading.Lock()
+_conversion_factors: Dict[Tuple[Unit, Unit], float] = {}
+
+
+def get_registry() -> UnitRegistry:
+    """
+    Returns the shared Pint unit registry, building it on first use.
+
+    The registry is also made Pint's application registry, so units and
+    quantities unpickled in this process (e.g. models returned by worker
+    processes) belong to it and can be compared with and converted to units
+    parsed here.
+
+    Returns:
+        UnitRegistry: The process-wide registry used by all Appetise models.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = UnitRegistry(cache_folder=UNIT_CACHE_FOLDER or None)
+                for definition in EXTRA_DEFINITIONS:
+                    registry.define(definition)
+                set_application_registry(registry)
+                _registry = registry
+    return _registry
+
+
+def get_kitchen_registry() -> UnitRegistry:
+    """
+    Returns the compact kitchen registry defined in ``kitchen_units.txt``.
+
+    The kitchen registry only knows the handful of culinary units Appetise
+    uses, so it is much cheaper to build than Pint's default registry. It is
+    used to check that units belong to the supported kitchen set.
+
+    Returns:
+        UnitRegistry: The process-wide kitchen registry.
+    """
+    global _kitchen_registry
+    if _kitchen_registry is None:
+        with _registry_lock:
+            if _kitchen_registry is None:
+                _kitchen_registry = UnitRegistry(str(KITCHEN_UNITS_FILE))
+    return _kitchen_registry
+
+
+def check_kitchen_unit(unit: Unit) -> Unit:
+    """
+    Validates that every component of a unit is a supported kitchen unit.
+
+    Args:
+        unit: The unit to check, from any registry.
+
+    Returns:
+        The unit, unchanged.
+
+    Raises:
+        ValueError: If the unit uses anything not defined in the kitchen registry.
+    """
+    kitchen = get_kitchen_registry()
+    unsupported = [name for name in unit._units if name not in kitchen]
+    if unsupported:
+        raise ValueError(
+            f"Unit '{unit}' is not a supported kitchen unit. Unsupported: {unsupported}"
+        )
+    return unit
+
+
+@lru_cache(maxsize=UNIT_PARSE_CACHE_SIZE)
+def parse_unit(text: str) -> Unit:
+    """
+    Parses a unit string into a Pint Unit, caching the result.
+
+    Kitchen aliases (see ``UNIT_ALIASES``) win, matched exactly and then in
+    lower case; anything else is handed to Pint in lower case and then as
+    written, so "Ml" is milliliters and "MG" milligrams, while case-sensitive
+    units such as "degC" still parse.
+    Parsed units are kept in a bounded LRU cache, whose hit and miss counters
+    are available from ``parse_unit.cache_info()``.
+
+    Args:
+        text: The unit string, e.g. "ml", "tbsp" or "gram".
+
+    Returns:
+        Unit: The parsed unit from the shared registry.
+
+    Raises:
+        ValueError: If the string is blank or is not a unit without a scaling factor.
+    """
+    cleaned = text.strip()
+    if not cleaned:
+        raise ValueError("Unit string must not be empty.")
+    registry = get_registry()
+    lowered = cleaned.lower()
+    alias = UNIT_ALIASES.get(cleaned) or UNIT_ALIASES.get(lowered)
+    candidates = (alias,) if alias is not None else (lowered, cleaned)
+    error: Optional[Exception] = None
+    for candidate in candidates:
+        try:
+            return registry.parse_units(candidate)
+        except Exception as e:  # Pint's parser raises a variety of error types.
+            error = e
+    raise ValueError(f"Invalid unit: '{text}'") from error
+
+
+@lru_cache(maxsize=UNIT_PARSE_CACHE_SIZE)
+def format_unit(unit: Unit) -> str:
+    """
+    Formats a unit as its canonical short string, e.g. "g", "ml" or "tbsp".
+
+    The result always parses back to the same unit with ``parse_unit``;
+    dimensionless units are written out as "dimensionless", and units whose
+    symbol reads as a kitchen unit (e.g. "C" for coulomb, "ML" for megaliter)
+    use their full name.
+
+    Args:
+        unit: The unit to format.
+
+    Returns:
+        str: The canonical short form of the unit.
+    """
+    if not unit._units:
+        return "dimensionless"
+    short = f"{unit:~}"
+    if parse_unit(short) != unit:
+        return f"{unit}"
+    return short
+
+
+class _PintUnitSchema:
+    """
+    Pydantic core schema for Pint units.
+
+    Accepts Unit instances or unit strings (parsed through ``parse_unit``) in
+    Python, expects a unit string in JSON, and serializes to JSON with
+    ``format_unit``, so models holding units use pydantic-core's JSON path.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        from_string = core_schema.no_info_after_validator_function(
+            parse_unit, core_schema.str_schema()
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_string,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(Unit), from_string]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                format_unit, when_used="json"
+            ),
+        )
+
+
+# Annotated Pint Unit type for use in Pydantic models.
+PintUnit = Annotated[Unit, _PintUnitSchema]
+
+
+def _compute_conversion_factor(source: Unit, target: Unit) -> float:
+    """
+    Computes the multiplicative factor converting ``source`` into ``target``.
+
+    Raises:
+        DimensionalityError: If the units are not compatible.
+        ValueError: If the conversion is not a pure scaling (e.g. temperatures).
+    """
+    registry = get_registry()
+    if registry.Quantity(0.0, source).to(target).magnitude != 0.0:
+        raise ValueError(
+            f"Cannot convert '{source}' to '{target}' with a single factor (offset units)."
+        )
+    return registry.Quantity(1.0, source).to(target).magnitude
+
+
+def _precompute_conversion_table() -> None:
+    """Fills the factor table for every compatible pair of kitchen units."""
+    registry = get_registry()
+    kitchen_units = [registry.parse_units(name) for name in KITCHEN_UNIT_NAMES]
+    for source in kitchen_units:
+        for target in kitchen_units:
+            if source.dimensionality == target.dimensionality:
+                _conversion_factors[source, target] = _compute_conversion_factor(
+                    source, target
+                )
+
+
+def conversion_factor(source: Unit, target: Unit) -> float:
+    """
+    Returns the cached factor converting a magnitude in ``source`` into ``target``.
+
+    All pairs of kitchen units are precomputed on first use; other pairs are
+    computed through Pint once and memoized, so repeated conversions are a
+    dictionary lookup instead of a walk over Pint's unit graph.
+
+    Args:
+        source: The unit the magnitude is expressed in.
+        target: The unit to convert to.
+
+    Returns:
+        float: Multiply a magnitude in ``source`` by this to express it in ``target``.
+
+    Raises:
+        DimensionalityError: If the units are not compatible.
+        ValueError: If the conversion is not a pure scaling (e.g. temperatures).
+    """
+    key = (source, target)
+    factor = _conversion_factors.get(key)
+    if factor is None:
+        if not _conversion_factors:
+            _precompute_conversion_table()
+            factor = _conversion_factors.get(key)
+        if factor is None:
+            factor = _compute_conversion_factor(source, target)
+            _conversion_factors[key] = factor
+    return factor
+
+
+def convert(magnitude: float, source: Unit, target: Unit) -> float:
+    """
+    Converts a magnitude between units using the cached factor table.
+
+    Args:
+        magnitude: The amount expressed in ``source``.
+        source: The unit the magnitude is expressed in.
+        target: The unit to convert to.
+
+    Returns:
+        float: The amount expressed in ``target``.
+    """
+    return magnitude * conversion_factor(source, target)
+
+
+@lru_cache(maxsize=None)
+def _nice_unit_ladder(unit: Unit) -> Tuple[Unit, ...]:
+    """Returns the ladder of nice units containing ``unit``, or an empty tuple."""
+    for ladder in NICE_UNIT_LADDERS:
+        if str(unit) in ladder:
+            return tuple(parse_unit(name) for name in ladder)
+    return ()
+
+
+def normalize_quantity(magnitude: float, unit: Unit) -> Tuple[float, Unit]:
+    """
+    Re-expresses an amount in the most readable unit of its family.
+
+    Picks the largest unit of the family in which the amount is at least 1,
+    e.g. 1500 gram becomes 1.5 kilogram and 48 teaspoon becomes 1 cup.
+    Units outside ``NICE_UNIT_LADDERS`` are returned unchanged.
+
+    Args:
+        magnitude: The amount expressed in ``unit``.
+        unit: The unit of the amount.
+
+    Returns:
+        Tuple[float, Unit]: The converted magnitude and its unit.
+    """
+    ladder = _nice_unit_ladder(unit)
+    if not ladder:
+        return magnitude, unit
+    best_unit = ladder[0]
+    for candidate in ladder:
+        if magnitude * conversion_factor(unit, candidate) >= 1:
+            best_unit = candidate
+    return magnitude * conversion_factor(unit, best_unit), best_unit
+
+
+@lru_cache(maxsize=None)
+def canonical_unit(unit: Unit) -> Unit:
+    """
+    Returns the unit used to aggregate quantities of the same dimensionality.
+
+    Mass aggregates in grams, volume in milliliters and counts as
+    dimensionless; any other dimensionality uses its Pint base units.
+
+    Args:
+        unit: Any unit.
+
+    Returns:
+        Unit: The canonical unit for ``unit``'s dimensionality.
+    """
+    registry = get_registry()
+    for name in ("gram", "milliliter", "dimensionless"):
+        candidate = parse_unit(name)
+        if candidate.dimensionality == unit.dimensionality:
+            return candidate
+    return registry.get_base_units(unit)[1]
+
+
+def __getattr__(name: str):
+    """Builds the shared registry lazily when ``units.ureg`` is first accessed."""
+    if name == "ureg":
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")